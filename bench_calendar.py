@@ -0,0 +1,65 @@
+"""
+Author: Davis Nguyen
+
+Benchmark for TripSchedule.calendars, which makes the calendar of one year
+for each of 1,000 travellers, and compares its time with calling available
+for each month of the year, as a calendar was made before. The calendars
+are checked against every trip in test_tripschedule.py.
+
+Run with: python bench_calendar.py [number of travellers] [trips per traveller]
+"""
+
+# Import the random, sys, and time modules for making trips and measuring.
+import random
+import sys
+import time
+
+# Import the Date, Trip, TripSchedule, and RecurringTrip classes.
+from date import Date
+from trip import Trip
+from tripschedule import TripSchedule
+from recurrence import RecurringTrip
+
+def traveller(count):
+    """
+    Function that returns the schedule of a traveller with count trips over
+    several years, and a visit every second Monday during 2024.
+    """
+    schedule = TripSchedule()
+    day = Date(1, 1, 2020) + random.randint(0, 10)
+    trips = []
+    for k in range(count):
+        trips.append(Trip("City {}".format(random.randint(0, 99)), day, random.randint(1, 4)))
+        day = day + 2 * trips[-1].duration() + random.randint(2, 10)
+    schedule.extend(trips)
+    try:
+        schedule.insert_recurring(RecurringTrip("Office", Date(1, 1, 2024), 1, 14, 26))
+    except Exception:
+        pass
+    return schedule
+
+def main():
+    """
+    Function that builds the schedules and times both ways of making the
+    calendars of 2024.
+    """
+    travellers = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    random.seed(1)
+    schedules = [traveller(count) for k in range(travellers)]
+
+    began = time.perf_counter()
+    calendars = TripSchedule.calendars(schedules, 2024)
+    batch = time.perf_counter() - began
+
+    began = time.perf_counter()
+    months = [[schedule.available(month, 2024) for month in range(1, 13)] for schedule in schedules]
+    by_month = time.perf_counter() - began
+
+    print("{} travellers with {} trips each, year 2024".format(travellers, count))
+    print("calendars:                {:7.3f} s".format(batch))
+    print("available for each month: {:7.3f} s".format(by_month))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Author: Davis Nguyen
+
+Benchmark for TripSchedule.diff and TripSchedule.apply, which keeps a
+schedule of 100,000 trips in step with an upstream copy in which 1% of
+the trips have been added, removed, or changed.
+
+Run with: python bench_diff.py [number of trips] [change rate]
+"""
+
+# Import the random, sys, and time modules for making trips and measuring.
+import random
+import sys
+import time
+
+# Import the Date, Trip, and TripSchedule classes.
+from date import Date
+from trip import Trip
+from tripschedule import TripSchedule
+
+# Number of trips inserted one at a time to estimate rebuilding by insert.
+SAMPLE = 20
+
+def main():
+    """
+    Function that builds the two schedules, times diff and apply, and
+    checks the schedules are the same afterwards.
+    """
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+    random.seed(1)
+
+    # Each trip departs on its own 10 day slot. Upstream, a share of the
+    # trips are removed, changed to a new destination and duration, or
+    # joined by a new trip in an empty slot, in about equal numbers.
+    start = Date(1, 1, 1800)
+    slots = list(range(size + size // 10))
+    random.shuffle(slots)
+    trips = [Trip("City {}".format(slot % 50), start + 10 * slot, 2) for slot in slots[:size]]
+    changes = int(size * rate)
+    upstream = trips[changes // 3:]
+    for i in range(changes // 3):
+        trip = upstream[i]
+        upstream[i] = Trip("Elsewhere", trip.departure(), 3)
+    upstream += [Trip("New", start + 10 * slot, 2) for slot in slots[size:size + changes - 2 * (changes // 3)]]
+
+    local = TripSchedule()
+    local.extend(trips)
+    other = TripSchedule()
+    other.extend(upstream)
+
+    began = time.perf_counter()
+    changeset = local.diff(other)
+    diffed = time.perf_counter() - began
+
+    began = time.perf_counter()
+    local.apply(changeset)
+    applied = time.perf_counter() - began
+
+    if len(local.diff(other)) != 0:
+        raise Exception("Schedules differ after applying the changeset.")
+
+    # Rebuilding from scratch by inserting one trip at a time checks each
+    # trip against all the trips before it, so time the last few inserts
+    # and estimate the rest from them, since the time grows with the size.
+    began = time.perf_counter()
+    rebuilt = TripSchedule()
+    rebuilt.extend(upstream[:-SAMPLE])
+    rebuild = time.perf_counter() - began
+    began = time.perf_counter()
+    for trip in upstream[-SAMPLE:]:
+        rebuilt.insert(trip)
+    per_insert = (time.perf_counter() - began) / SAMPLE
+
+    print("{} trips, {} changes({})".format(size, len(changeset), changeset))
+    print("diff:                                {:8.3f} s".format(diffed))
+    print("apply:                               {:8.3f} s".format(applied))
+    print("rebuild from scratch, extend:        {:8.3f} s".format(rebuild))
+    print("rebuild from scratch, insert(est.):  {:8.1f} s".format(per_insert * len(upstream) / 2))
+
+
+if __name__ == "__main__":
+    main()
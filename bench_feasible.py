@@ -0,0 +1,78 @@
+"""
+Author: Davis Nguyen
+
+Benchmark for TripSchedule.feasible, which checks 10,000 candidate trips
+against a schedule of 100,000 trips, and compares it with inserting each
+candidate into a copy of the schedule and catching the exception.
+
+Run with: python bench_feasible.py [number of trips] [number of candidates]
+"""
+
+# Import the random, sys, and time modules for making trips and measuring.
+import random
+import sys
+import time
+
+# Import the Date, Trip, and TripSchedule classes.
+from date import Date
+from trip import Trip
+from tripschedule import TripSchedule
+
+# Number of candidates checked by inserting into a copy of the schedule.
+# Doing this for every candidate would take far too long.
+SAMPLE = 5
+
+def insert_on_copy(trips, candidate):
+    """
+    Function that returns (accepted, reason) for a candidate by inserting it
+    into a copy of the schedule holding trips.
+    """
+    schedule = TripSchedule()
+    schedule.extend(trips)
+    try:
+        schedule.insert(candidate)
+    except Exception as e:
+        return (False, str(e))
+    return (True, None)
+
+def main():
+    """
+    Function that builds the schedule and candidates, times both ways of
+    checking them, and checks that they agree.
+    """
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    random.seed(1)
+
+    # The schedule has a trip of 1 to 3 days every 5 days, and each
+    # candidate departs on a random day in the same span.
+    start = Date(1, 1, 1800)
+    trips = [Trip("City {}".format(k % 50), start + 5 * k, random.randint(1, 3)) for k in range(size)]
+    candidates = [Trip("Somewhere", start + random.randrange(5 * size), random.randint(1, 6))
+                  for k in range(count)]
+    schedule = TripSchedule()
+    schedule.extend(trips)
+
+    began = time.perf_counter()
+    results = schedule.feasible(candidates)
+    first = time.perf_counter() - began
+    began = time.perf_counter()
+    schedule.feasible(candidates)
+    second = time.perf_counter() - began
+
+    began = time.perf_counter()
+    sample = [insert_on_copy(trips, candidate) for candidate in candidates[:SAMPLE]]
+    per_copy = (time.perf_counter() - began) / SAMPLE
+    if sample != results[:SAMPLE]:
+        raise Exception("feasible disagrees with inserting into a copy.")
+
+    accepted = sum(1 for ok, reason in results if ok)
+    print("{} candidates against {} trips, {} accepted".format(count, size, accepted))
+    print("feasible, first call(builds the index): {:8.3f} s".format(first))
+    print("feasible, second call:                   {:8.3f} s".format(second))
+    print("insert on a copy, per candidate:         {:8.3f} s".format(per_copy))
+    print("insert on a copy, all candidates(est.):  {:8.1f} s".format(per_copy * count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Author: Davis Nguyen
+
+Benchmark for ScheduleSnapshot, which shows that the memory taken by
+snapshots grows with the number of changes made between them rather than
+with the size of the schedule.
+
+Run with: python bench_snapshot.py
+"""
+
+# Import the time and tracemalloc modules for measuring.
+import time
+import tracemalloc
+
+# Import the Date, Trip, and TripSchedule classes.
+from date import Date
+from trip import Trip
+from tripschedule import TripSchedule
+
+def run(size, edits):
+    """
+    Function that builds a schedule of size trips, takes a snapshot, and
+    then makes edits changes, taking a snapshot after each one and keeping
+    them all. Returns the time of the first snapshot and the memory taken
+    by the changes and snapshots after it.
+    """
+    start = Date(1, 1, 1900)
+    schedule = TripSchedule()
+    schedule.extend([Trip("City", start + 3 * k, 1) for k in range(size)])
+
+    began = time.perf_counter()
+    snapshots = [schedule.snapshot()]
+    first = time.perf_counter() - began
+
+    # Each edit deletes the first trip left in the schedule. Deleting is
+    # used rather than inserting since insert checks every trip in the
+    # schedule, which would make the benchmark slow without changing the
+    # memory the snapshots take.
+    tracemalloc.start()
+    for k in range(edits):
+        schedule.delete(schedule[0])
+        snapshots.append(schedule.snapshot())
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return first, used
+
+def main():
+    """
+    Function that prints the memory taken per change for several schedule
+    sizes and numbers of changes.
+    """
+    print("{:>8} {:>7} {:>14} {:>12} {:>13}".format(
+        "trips", "edits", "first snap(s)", "memory(KB)", "bytes/edit"))
+    for size in (10000, 100000, 1000000):
+        for edits in (1000, 10000):
+            first, used = run(size, edits)
+            print("{:>8} {:>7} {:>14.3f} {:>12.0f} {:>13.0f}".format(
+                size, edits, first, used / 1024, used / edits))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Author: Davis Nguyen
+
+Benchmark for the start up of a short-lived program using the schedule
+modules: the time taken to import tripschedule, and the time taken by the
+first calls that need the tables in Date, measured in fresh processes.
+
+Run with: python bench_startup.py [number of runs]
+"""
+
+# Import the compileall, os, statistics, subprocess, and sys modules for
+# running and timing fresh processes.
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+
+# Program run in each fresh process. It prints the seconds taken by each
+# step, one per line.
+PROGRAM = """
+import time
+began = time.perf_counter()
+import tripschedule
+from date import Date
+from trip import Trip
+imported = time.perf_counter()
+Date(3, 15, 2024).daycount()
+first_daycount = time.perf_counter()
+Date(3, 15, 2024).daycount()
+second_daycount = time.perf_counter()
+schedule = tripschedule.TripSchedule()
+schedule.insert(Trip("City", Date(3, 15, 2024), 3))
+schedule.available(3, 2024)
+first_available = time.perf_counter()
+schedule.available(4, 2024)
+second_available = time.perf_counter()
+print(imported - began)
+print(first_daycount - imported)
+print(second_daycount - first_daycount)
+print(first_available - second_daycount)
+print(second_available - first_available)
+"""
+
+# Names of the steps timed by the program, in the order they are printed.
+STEPS = ("import tripschedule", "first daycount", "second daycount",
+         "first available", "second available")
+
+def main():
+    """
+    Function that runs the program in fresh processes and prints the
+    median time of each step.
+    """
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    # Compile the modules first, so the times do not include compiling them
+    # when Python is not allowed to save compiled modules.
+    compileall.compile_dir(os.path.dirname(os.path.abspath(__file__)), maxlevels=0, quiet=1)
+
+    times = [[] for step in STEPS]
+    for run in range(runs):
+        output = subprocess.run([sys.executable, "-c", PROGRAM], capture_output=True,
+                                text=True, check=True).stdout.split()
+        for i, seconds in enumerate(output):
+            times[i].append(float(seconds))
+
+    print("Median of {} fresh processes:".format(runs))
+    for step, seconds in zip(STEPS, times):
+        print("{:>20}: {:8.3f} ms".format(step, statistics.median(seconds) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Author: Davis Nguyen
+
+Benchmark for CompactTripStore, which compares the memory taken by a
+schedule kept as a list of Trip objects(TripList) with one kept in a
+CompactTripStore, along with the time taken to fill and sort each.
+
+Run with: python bench_tripstore.py [number of trips ...]
+For example, python bench_tripstore.py 1000000 measures a million trips.
+"""
+
+# Import the sys, time, and tracemalloc modules for measuring.
+import sys
+import time
+import tracemalloc
+
+# Import the Date, Trip, TripSchedule, and CompactTripStore classes.
+from date import Date
+from trip import Trip
+from tripschedule import TripSchedule
+from tripstore import CompactTripStore
+
+def trips(size):
+    """
+    Function that returns an iterator over size trips to a few hundred
+    destinations, in reverse order of departure so sorting has work to do.
+    """
+    start = Date(1, 1, 1800)
+    for k in range(size - 1, -1, -1):
+        yield Trip("City {}".format(k % 300), start + 3 * k, 1 + k % 2)
+
+def run(size, storage):
+    """
+    Function that fills a schedule held in storage with size trips and sorts
+    it. Returns the memory the schedule takes and the seconds taken to fill
+    it and to sort it.
+    """
+    tracemalloc.start()
+    began = time.perf_counter()
+    schedule = TripSchedule(storage)
+    schedule.extend(trips(size))
+    filled = time.perf_counter() - began
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    began = time.perf_counter()
+    schedule.sortbydeparture()
+    sorted_in = time.perf_counter() - began
+    return used, filled, sorted_in
+
+def main():
+    """
+    Function that prints the memory and times for each kind of store, for
+    the numbers of trips given on the command line.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000]
+    print("{:>8} {:>16} {:>12} {:>10} {:>8} {:>10}".format(
+        "trips", "store", "memory(MB)", "bytes/trip", "fill(s)", "sort(s)"))
+    for size in sizes:
+        for name, storage in (("TripList", None), ("CompactTripStore", CompactTripStore())):
+            used, filled, sorted_in = run(size, storage)
+            print("{:>8} {:>16} {:>12.2f} {:>10.0f} {:>8.2f} {:>10.3f}".format(
+                size, name, used / 2 ** 20, used / size, filled, sorted_in))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Author: Davis Nguyen
+
+Changeset class holds the differences between two trip schedules, which
+can be used for things such as keeping a schedule in step with a feed
+of bookings.
+
+Note: Changesets are made with TripSchedule.diff and used with
+TripSchedule.apply. Trips are matched between schedules by departure
+date, since no two trips in a schedule depart on the same day.
+"""
+
+class Changeset:
+    """
+    Class called "Changeset" that keeps track of the trips added, removed,
+    and changed between two trip schedules.
+    """
+
+    def __init__(self, added=(), removed=(), changed=()):
+        """
+        Constructor that creates a changeset.
+
+        added: a list of Trip objects that are new.
+        removed: a list of Trip objects that are gone.
+        changed: a list of (old, new) tuples of Trip objects that depart on
+        the same day but differ in destination or duration.
+        """
+        self.__added = list(added)
+        self.__removed = list(removed)
+        self.__changed = list(changed)
+
+    def added(self):
+        """
+        Method that returns a list of the trips that are new.
+        """
+        return list(self.__added)
+
+    def removed(self):
+        """
+        Method that returns a list of the trips that are gone.
+        """
+        return list(self.__removed)
+
+    def changed(self):
+        """
+        Method that returns a list of (old, new) tuples of the trips that
+        have changed.
+        """
+        return list(self.__changed)
+
+    def __len__(self):
+        """
+        Method that returns the number of changes in the changeset.
+        """
+        return len(self.__added) + len(self.__removed) + len(self.__changed)
+
+    def __str__(self):
+        """
+        Method that returns a short summary of the changeset.
+        """
+        return "{} added, {} removed, {} changed".format(
+            len(self.__added), len(self.__removed), len(self.__changed))
+
+    def __repr__(self):
+        """
+        Method that returns a suitable string representation of the changeset.
+        """
+        return str(self)
@@ -0,0 +1,338 @@
+"""
+Author: Davis Nguyen
+
+ConcurrentTripSchedule class is a TripSchedule that can be shared
+between several threads, such as the workers of a web server.
+
+Note: Any number of threads can read the schedule at the same time,
+but a thread that changes the schedule(insert, delete, sortbydeparture)
+has it to itself while it does so.
+"""
+
+# Import the threading and contextlib modules for the lock.
+import threading
+from contextlib import contextmanager
+
+# Import the TripSchedule and TripScheduleIterator classes.
+from tripschedule import TripSchedule, TripScheduleIterator
+
+class ReadWriteLock:
+    """
+    Class called "ReadWriteLock" that can be held by many readers at once
+    or by a single writer. Writers that are waiting go before new readers,
+    so a steady stream of readers cannot keep a writer out forever.
+
+    Note: The lock is not reentrant. A thread holding it must not try to
+    acquire it again.
+    """
+
+    def __init__(self):
+        """
+        Constructor that creates an unlocked reader-writer lock.
+        """
+
+        # Condition used by threads to wait for the lock to be free.
+        self.__cond = threading.Condition(threading.Lock())
+
+        # Number of readers holding the lock, whether a writer holds the
+        # lock, and the number of writers waiting for it.
+        self.__readers = 0
+        self.__writer = False
+        self.__waiting_writers = 0
+
+    def acquire_read(self):
+        """
+        Method that waits until no writer holds or waits for the lock and
+        then acquires it for reading.
+        """
+        with self.__cond:
+            while self.__writer or self.__waiting_writers > 0:
+                self.__cond.wait()
+            self.__readers += 1
+
+    def release_read(self):
+        """
+        Method that releases the lock after reading.
+        """
+        with self.__cond:
+            self.__readers -= 1
+
+            # When the last reader leaves, wake up any waiting writers.
+            if self.__readers == 0:
+                self.__cond.notify_all()
+
+    def acquire_write(self):
+        """
+        Method that waits until nobody holds the lock and then acquires it
+        for writing.
+        """
+        with self.__cond:
+            self.__waiting_writers += 1
+            while self.__writer or self.__readers > 0:
+                self.__cond.wait()
+            self.__waiting_writers -= 1
+            self.__writer = True
+
+    def release_write(self):
+        """
+        Method that releases the lock after writing.
+        """
+        with self.__cond:
+            self.__writer = False
+            self.__cond.notify_all()
+
+    @contextmanager
+    def reading(self):
+        """
+        Method that holds the lock for reading inside a with statement.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def writing(self):
+        """
+        Method that holds the lock for writing inside a with statement.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentTripSchedule(TripSchedule):
+    """
+    Class called "ConcurrentTripSchedule" that is a trip schedule that can
+    be safely used by many threads at once.
+    """
+
+    def __init__(self, storage=None):
+        """
+        Constructor that creates an empty trip schedule and the lock
+        that protects it.
+
+        storage: an empty store to keep the trips in, as for TripSchedule.
+        """
+        super().__init__(storage)
+        self.__lock = ReadWriteLock()
+
+    def insert(self, new_trip):
+        """
+        Method that adds a new trip to the schedule while holding the lock
+        for writing.
+
+        new_trip: a Trip object to be added to the trip schedule.
+        """
+        with self.__lock.writing():
+            super().insert(new_trip)
+
+    def extend(self, new_trips):
+        """
+        Method that adds many new trips to the schedule at once while holding
+        the lock for writing.
+
+        new_trips: a list of Trip objects to be added to the trip schedule.
+        """
+        with self.__lock.writing():
+            super().extend(new_trips)
+
+    def delete(self, trip):
+        """
+        Method that deletes a trip from the schedule while holding the lock
+        for writing.
+
+        trip: a Trip object in the schedule to be removed.
+        """
+        with self.__lock.writing():
+            super().delete(trip)
+
+    def apply(self, changeset):
+        """
+        Method that makes the changes in a changeset to the schedule while
+        holding the lock for writing, and returns the trips removed.
+
+        changeset: a Changeset, such as one returned by diff.
+        """
+        with self.__lock.writing():
+            return super().apply(changeset)
+
+    def diff(self, other):
+        """
+        Method that returns the changes that would turn this schedule into
+        other while holding the lock of this schedule for reading. If other
+        is shared between threads too, it must not change meanwhile.
+
+        other: a second TripSchedule.
+        """
+        with self.__lock.reading():
+            return super().diff(other)
+
+    def insert_recurring(self, rule):
+        """
+        Method that adds a recurring trip to the schedule while holding the
+        lock for writing.
+
+        rule: a RecurringTrip object to be added to the trip schedule.
+        """
+        with self.__lock.writing():
+            super().insert_recurring(rule)
+
+    def delete_recurring(self, rule):
+        """
+        Method that deletes a recurring trip from the schedule while holding
+        the lock for writing.
+
+        rule: a RecurringTrip object in the schedule to be removed.
+        """
+        with self.__lock.writing():
+            super().delete_recurring(rule)
+
+    def recurring(self):
+        """
+        Method that returns a list of the recurring trips in the schedule
+        while holding the lock for reading.
+        """
+        with self.__lock.reading():
+            return super().recurring()
+
+    def snapshot(self):
+        """
+        Method that returns a read-only snapshot of the schedule. The lock is
+        held for writing, since the first snapshot sets up the history of
+        the schedule.
+        """
+        with self.__lock.writing():
+            return super().snapshot()
+
+    def sortbydeparture(self):
+        """
+        Method that sorts the trips in the schedule by departure date while
+        holding the lock for writing.
+        """
+        with self.__lock.writing():
+            super().sortbydeparture()
+
+    def __len__(self):
+        """
+        Method that returns the number of trips in the schedule.
+        """
+        with self.__lock.reading():
+            return super().__len__()
+
+    def __getitem__(self, j):
+        """
+        Method that returns the j-th trip in the schedule.
+
+        j: an index value used for the trip schedule list.
+        """
+        with self.__lock.reading():
+            return super().__getitem__(j)
+
+    def __iter__(self):
+        """
+        Method that returns an iterator over a snapshot of the schedule.
+        The snapshot is copied while holding the lock for reading, so the
+        iterator never sees a half-finished change and never blocks writers.
+        """
+        with self.__lock.reading():
+            trips = list(super().__iter__())
+        return TripScheduleIterator(trips)
+
+    def search(self, keyword):
+        """
+        Method that prints the trips matching keyword while holding the
+        lock for reading.
+
+        keyword: a value that can either be an integer or a string.
+        """
+        with self.__lock.reading():
+            super().search(keyword)
+
+    def feasible(self, candidates):
+        """
+        Method that checks many candidate trips against the schedule at once
+        while holding the lock for reading.
+
+        candidates: a list of Trip objects.
+        """
+        with self.__lock.reading():
+            return super().feasible(candidates)
+
+    def available(self, month, year):
+        """
+        Method that returns the available dates in month of year while
+        holding the lock for reading.
+
+        month: an integer between 1 and 12 representing a month.
+        year: an integer representing a year.
+        """
+        with self.__lock.reading():
+            return super().available(month, year)
+
+    def calendar(self, year, layout=None):
+        """
+        Method that returns a calendar of the schedule for a year while
+        holding the lock for reading.
+
+        year: an integer representing a year.
+        layout: the layout of the year from yearcalendar.year_layout, or None.
+        """
+        with self.__lock.reading():
+            return super().calendar(year, layout)
+
+    def weekend_travel(self, yr):
+        """
+        Method that returns the trips in year yr that involve weekend travel
+        while holding the lock for reading.
+
+        yr: an integer representing a year.
+        """
+        with self.__lock.reading():
+            return super().weekend_travel(yr)
+
+    def group_by_destination(self):
+        """
+        Method that returns the trips in the schedule grouped by destination
+        while holding the lock for reading.
+        """
+        with self.__lock.reading():
+            return super().group_by_destination()
+
+    def earliest(self):
+        """
+        Method that returns the trip with the earliest departure date while
+        holding the lock for reading.
+        """
+        with self.__lock.reading():
+            return super().earliest()
+
+    def last(self):
+        """
+        Method that returns the trip with the latest departure date while
+        holding the lock for reading.
+        """
+        with self.__lock.reading():
+            return super().last()
+
+    def between(self, start, end):
+        """
+        Method that returns the trips travelling on any date from start to end
+        while holding the lock for reading.
+
+        start: a Date object of the first date of the range.
+        end: a Date object of the last date of the range.
+        """
+        with self.__lock.reading():
+            return super().between(start, end)
+
+    def __str__(self):
+        """
+        Method that returns a string representation of the trip schedule
+        while holding the lock for reading.
+        """
+        with self.__lock.reading():
+            return super().__str__()
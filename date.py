@@ -3,8 +3,57 @@ Author: Davis Nguyen
 
 Date class implements calendar dates which can be used for things
 such as keeping track of a travel schedule.
+
+Note: Dates are turned into day counts(see Date.daycount) using a table of
+the number of days before each year from 1800 to 9999. The table is only
+built as far as the years that are needed, when they are first needed, so
+importing this module is cheap.
 """
 
+# Import the array module for the table of days before each year.
+from array import array
+
+# The largest year covered by the table of days before each year. Day
+# counts in later years are worked out without the table.
+_TABLE_MAX_YEAR = 9999
+
+# Table where entry i is the number of days from January 1, 1800 to
+# January 1 of the year 1800 + i. It is built by _days_before_year, which
+# adds to it when a later year is needed.
+_year_table = array("i", [0])
+
+def _is_leap(year):
+    """
+    Function that returns True if year is a leap year and False otherwise.
+    """
+    return (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+
+def _days_before_year(year):
+    """
+    Function that returns the number of days from January 1, 1800 to
+    January 1 of year.
+    """
+    global _year_table
+
+    # If the year is past the end of the table, count the leap years with
+    # the rule for them instead: every 4th year, except every 100th year,
+    # except every 400th year.
+    if year > _TABLE_MAX_YEAR:
+        leap_days = lambda y: y // 4 - y // 100 + y // 400
+        return 365 * (year - Date.min_year) + leap_days(year - 1) - leap_days(Date.min_year - 1)
+
+    # If the year is past the end of the table built so far, build a longer
+    # table, at least twice as long, and then put it in place of the old one.
+    # The old table is never changed, so other threads can keep using it.
+    if year - Date.min_year >= len(_year_table):
+        table = array("i", _year_table)
+        end = min(max(year, Date.min_year + 2 * len(table)), _TABLE_MAX_YEAR)
+        for y in range(Date.min_year + len(table) - 1, end):
+            table.append(table[-1] + (366 if _is_leap(y) else 365))
+        _year_table = table
+
+    return _year_table[year - Date.min_year]
+
 class Date():
     """
     Class called "Date" that implements calendar dates occurring on or
@@ -19,6 +68,21 @@ class Date():
     # min_year.
     dow_jan1 = "Wednesday"
 
+    # Class attribute that is a tuple of the number of days in each month of a
+    # year that is not a leap year.
+    days_in_month = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+    # Class attribute that is a tuple of the number of days before the first
+    # day of each month, for a year that is not a leap year and for a leap year.
+    days_before_month = ((0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334),
+                         (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335))
+
+    # Class attributes that are tuples of the string names of each month and
+    # of the days of week.
+    month_names = ("January", "February", "March", "April", "May", "June", "July",
+                   "August", "September", "October", "November", "December")
+    day_names = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
     def __init__(self, month=1, day=1, year=min_year):
         """
         Constructor that sets the values of the month, day, and year attributes
@@ -34,9 +98,6 @@ class Date():
         self.__dy = day
         self.__yr = year
 
-        # List of the number of days in each month.
-        days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-
         # If the month is a wrong input, raise an exception for an invalid month.
         if 12 < month or month < 1:
             raise Exception("Invalid Month")
@@ -45,13 +106,8 @@ class Date():
         if year < self.min_year:
             raise Exception("Invalid Year")
 
-        # If the year is a leap year, change the amount of days of February in the
-        # list of month days to 29. Check for leap year using year_is_leap method.
-        if self.year_is_leap():
-            days_in_month[1] = 29
-
         # If the day is a wrong input, raise an exception for an invalid day.
-        if day < 1 or day > days_in_month[month - 1]:
+        if day < 1 or day > self.__month_length(month):
             raise Exception("Invalid Day")
 
     def month(self):
@@ -99,134 +155,63 @@ class Date():
         the start date January 1, 1800 to the date inputted by the user.
         """
 
-        # List of the number of days in each month.
-        days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-
-        # If the year of the date is a leap year, change the number of days
-        # in February to 29 in the days in month list.
-        if self.year_is_leap():
-            days_in_month[1] = 29
-
-        # Set a variable for the day count which will be added to and returned.
-        day_count = 0
-
-        # Create a Date object for the start date.
-        start_date = Date(1, 1, self.min_year)
-        
-        # While loop that adds the days in each year from the start date to
-        # the input date.
-        while start_date.year() < self.year():
+        # Add the days before the year, the days before the month in that
+        # year, and the date's days.
+        leap = 1 if self.year_is_leap() else 0
+        return _days_before_year(self.__yr) + self.days_before_month[leap][self.__mth - 1] + self.__dy
 
-            # Add 365 to the day count since there are 365 days in a year.
-            day_count += 365
-
-            # If the year is a leap year, add 1 to the day count because leap
-            # years have 1 extra day.
-            if start_date.year_is_leap():
-                day_count += 1
-                
-            # Add 1 to the year of the Date object to iterate through the next year.
-            start_date = Date(1, 1, start_date.year() + 1)
+    @classmethod
+    def fromdaycount(cls, day_count):
+        """
+        Method that returns the Date object whose day count (see daycount)
+        is day_count. This is the opposite of the daycount method.
 
-        # While loop that adds the days in each month from the start date to
-        # the input date.
-        while start_date.month() < self.month():
+        day_count: an integer >= 1, where 1 is January 1, 1800.
+        """
 
-            # Add the amount of days in a month to the day count.
-            day_count += days_in_month[start_date.month() - 1]
+        # If the day count is before the start date, raise an exception.
+        if day_count < 1:
+            raise Exception("Invalid Day Count")
 
-            # Add 1 to the month of the Date object to iterate through the next month.
-            start_date = Date(start_date.month() + 1, 1, start_date.year())
+        # Guess the year using the average length of a year, which is 146097
+        # days every 400 years, and then correct the guess if it is off by one.
+        year = cls.min_year + (day_count - 1) * 400 // 146097
+        while _days_before_year(year) >= day_count:
+            year -= 1
+        while _days_before_year(year + 1) < day_count:
+            year += 1
 
-        # Add the date's days onto the day count.
-        day_count += self.day()
+        # Find the month whose first day comes last before the day count.
+        day_of_year = day_count - _days_before_year(year)
+        month_starts = cls.days_before_month[1 if _is_leap(year) else 0]
+        month = 12
+        while month_starts[month - 1] >= day_of_year:
+            month -= 1
 
-        # Return the day count after the loops finish adding all the days.
-        return day_count
+        return cls(month, day_of_year - month_starts[month - 1], year)
 
     def day_of_week(self):
         """
         Method that returns the day of the week of the date.
         """
-        
-        # List of string names of the days of week.
-        day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-
-        # Count variable that counts days in a week to keep track of what
-        # day of the week the day is on.
-        count_days = 0
-
-        # Save the index of the default day of the week in a variable. This uses
-        # the day_names list which contains each day of the week.
-        dow_index = day_names.index(self.dow_jan1)
-
-        # Iterate through the day count of the date. As each day passes, add
-        # 1 to the count variable. When the for loop ends, the number in the
-        # count variable represents the day of the week the date is on.
-        for i in range(0, self.daycount() - 1):
-            count_days += 1
-
-            # When the count variable reaches 7, that means it has been a full
-            # week, so reset the count to 0 to start a new week.
-            if count_days == 7:
-                count_days = 0
-
-        # If the count is 0, this means it has been 7 days or 1 week, so the
-        # day of week is the start day, which in this case, is Wednesday.
-        if count_days == 0:
-            return day_names[dow_index]
-
-        # If the count is 1, it has been 1 day after the start, which in
-        # this case, is Thursday.
-        if count_days == 1:
-            return day_names[(dow_index + 1) % 7]
-
-        # If the count is 2, it has been 2 days after the start, which in
-        # this case, is Friday.
-        if count_days == 2:
-            return day_names[(dow_index + 2) % 7]
-
-         # If the count is 3, it has been 3 days after the start, which in
-        # this case, is Saturday.
-        if count_days == 3:
-            return day_names[(dow_index + 3) % 7]
-
-        # If the count is 4, it has been 4 days after the start, which in
-        # this case, is Sunday.
-        if count_days == 4:
-            return day_names[(dow_index + 4) % 7]
-
-        # If the count is 5, it has been 5 days after the start, which in
-        # this case, is Monday.
-        if count_days == 5:
-            return day_names[(dow_index + 5) % 7]
-
-        # If the count is 6, it has been 6 days after the start, which in
-        # this case, is Tuesday.
-        if count_days == 6:
-            return day_names[(dow_index + 6) % 7]
+
+        # Days of the week repeat every 7 days, so count on from the day of
+        # week of the start date by the number of days since it.
+        return self.day_names[(self.day_names.index(self.dow_jan1) + self.daycount() - 1) % 7]
 
     def nextday(self):
         """
         Method that returns the date of the following/next day.
         """
 
-        # List of the number of days in each month.
-        days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-
         # Create variables of the month, day, and year of the date that will be changed.
         new_day = self.__dy
         new_month = self.__mth
         new_year = self.__yr
 
-        # If the year of the date is a leap year, change the number of days
-        # in February to 29 in the days in month list. 
-        if self.year_is_leap():
-            days_in_month[1] = 29
-
         # If adding 1 to the day is greater than the amount of days in the current month,
         # that means it is a new month, so add 1 to the month and set the day to 0.
-        if (new_day + 1) > days_in_month[new_month-1]:
+        if (new_day + 1) > self.__month_length(new_month):
             new_month += 1
             new_day = 0
 
@@ -252,14 +237,6 @@ class Date():
         if self.__mth == 1 and self.__dy == 1 and self.__yr == self.min_year:
             raise Exception("January 1, 1800 does not have a previous day.")
 
-        # List of the number of days in each month.
-        days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-
-        # If the year of the date is a leap year, change the number of days
-        # in February to 29 in the days in month list.
-        if self.year_is_leap():
-            days_in_month[1] = 29
-
         # Create variables of the month, day, and year of the date that will be changed.
         new_day = self.__dy
         new_month = self.__mth
@@ -277,7 +254,7 @@ class Date():
                 new_year -= 1
 
             # When it is a new month, set the day equal to the amount of days of the month.
-            new_day = days_in_month[new_month-1] + 1
+            new_day = self.__month_length(new_month) + 1
 
         # After the if statements, subtract 1 from the day to have the previous day of the date.
         new_day -= 1
@@ -292,17 +269,12 @@ class Date():
         n: an integer
         """
 
-        # Create a Date object of the inputted date that will be changed.
-        new_date = Date(self.__mth, self.__dy, self.__yr)
+        # If n is not positive, return a copy of the date.
+        if n <= 0:
+            return Date(self.__mth, self.__dy, self.__yr)
 
-        # Use a for loop to iterate through n days.
-        for i in range(n):
-
-            # As the loop iterates, call the nextday method onto the date to add a day.
-            new_date = new_date.nextday()
-
-        # Return the Date object of the new date n days after the inputted date.
-        return new_date
+        # Return the Date object whose day count is n days after the inputted date.
+        return Date.fromdaycount(self.daycount() + n)
 
     def __sub__(self, n):
         """
@@ -316,17 +288,17 @@ class Date():
         if self.__mth == 1 and self.__dy == 1 and self.__yr == self.min_year:
             raise Exception("January 1, 1800 does not have previous days.")
 
-        # Create a Date object of the inputted date that will be changed.
-        new_date = Date(self.__mth, self.__dy, self.__yr)
-
-        # Use a for loop to iterate through n days.
-        for i in range(n):
+        # If n is not positive, return a copy of the date.
+        if n <= 0:
+            return Date(self.__mth, self.__dy, self.__yr)
 
-            # As the loop iterates, call the prevday method onto the date to subtract a day.
-            new_date = new_date.prevday()
+        # If going back n days goes past the start date, raise an Exception.
+        day_count = self.daycount() - n
+        if day_count < 1:
+            raise Exception("January 1, 1800 does not have a previous day.")
 
-        # Return the Date object of the new date n days before the inputted date.
-        return new_date
+        # Return the Date object whose day count is n days before the inputted date.
+        return Date.fromdaycount(day_count)
 
     def __lt__(self, other):
         """
@@ -392,12 +364,7 @@ class Date():
         """
         Method that returns a printable(i.e.,string) representation of the date.
         """
-        
-        # List of string names of each month.
-        month_names = ["January", "February", "March", "April", "May", "June", "July"
-            , "August", "September", "October", "November", "December"]
-        
-        return month_names[self.__mth - 1] + " " + str(self.__dy) + ", " + str(self.__yr)
+        return self.month_names[self.__mth - 1] + " " + str(self.__dy) + ", " + str(self.__yr)
 
     def __repr__(self):
         """
@@ -405,4 +372,10 @@ class Date():
         """
         return str(self)
 
-
+    def __month_length(self, month):
+        """
+        Method that returns the number of days in month of the date's year.
+        """
+        if month == 2 and self.year_is_leap():
+            return 29
+        return self.days_in_month[month - 1]
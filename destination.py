@@ -0,0 +1,176 @@
+"""
+Author: Davis Nguyen
+
+DestinationCatalogue class keeps a list of destination cities, giving
+each one a number so that trips to the same city can be found quickly.
+
+Note: Destination names are compared without regard to upper or lower
+case or extra spaces, so "paris" and "Paris " are the same city. The
+catalogue used by Trip and TripSchedule is shared, and is the module
+attribute catalogue. It can be used by many threads at once.
+
+A destination keeps its id for as long as the program runs, so the
+catalogue grows with the number of different destinations seen. The ways
+of writing each destination are remembered too, but only up to a limit,
+so a program that runs for a long time does not keep every one forever.
+"""
+
+# Import the threading module for the lock, and the bisect functions for
+# the sorted index of names.
+import threading
+from bisect import bisect_left, insort
+
+def normalise(name):
+    """
+    Function that returns the form of a destination name used to compare it
+    with others: lower case, with no spaces at the ends and single spaces
+    between words. A destination that is not a string is compared by its
+    string form.
+    """
+    return " ".join(str(name).split()).casefold()
+
+
+class DestinationCatalogue:
+    """
+    Class called "DestinationCatalogue" that gives each destination city a
+    number(its id) and finds destinations by name or by the start of a name.
+    """
+
+    def __init__(self, max_spellings=100000):
+        """
+        Constructor that creates an empty destination catalogue.
+
+        max_spellings: the most ways of writing destinations to remember.
+        When there are more, they are all forgotten and remembered again as
+        they are next seen, which only costs normalising them again.
+        """
+
+        # The id of each normalised name, and the name of each destination in
+        # order of id, as it was first written(with extra spaces removed).
+        self.__ids = {}
+        self.__names = []
+
+        # A tuple (name, id) for each way of writing a destination that has
+        # been seen, so a name that was seen before is found without
+        # normalising it again. The name in the tuple is shared by every trip
+        # written the same way.
+        self.__spellings = {}
+        self.__max_spellings = max_spellings
+
+        # A list of (normalised name, id) tuples, sorted by name, for finding
+        # destinations by the start of their names.
+        self.__index = []
+
+        # The lock held while a destination or a way of writing one is added,
+        # so that two threads adding destinations at once cannot give them
+        # the same id. Names already seen are found without it.
+        self.__lock = threading.Lock()
+
+    def intern(self, name):
+        """
+        Method that returns the id of a destination, adding the destination
+        to the catalogue if it is new.
+
+        name: the destination name(a string).
+        """
+        return self.__spelling(name)[1]
+
+    def spelling(self, name):
+        """
+        Method that adds a destination to the catalogue and returns the string
+        the catalogue keeps for the way name is written. Every trip written
+        the same way can then share that one string.
+
+        name: the destination name(a string).
+        """
+        return self.__spelling(name)[0]
+
+    def entry(self, name):
+        """
+        Method that adds a destination to the catalogue and returns a tuple
+        of the string the catalogue keeps for the way name is written and the
+        id of the destination, so both can be kept by a trip.
+
+        name: the destination name(a string).
+        """
+        return self.__spelling(name)
+
+    def lookup(self, name):
+        """
+        Method that returns the id of a destination, or None if the
+        destination is not in the catalogue.
+
+        name: the destination name(a string).
+        """
+        found = self.__spellings.get(name) if isinstance(name, str) else None
+        if found is not None:
+            return found[1]
+        return self.__ids.get(normalise(name))
+
+    def name(self, destination_id):
+        """
+        Method that returns the name of the destination with a given id.
+
+        destination_id: the id of a destination(an integer).
+        """
+        return self.__names[destination_id]
+
+    def prefix(self, text):
+        """
+        Method that returns a list of the ids of the destinations whose names
+        start with text, sorted by name.
+
+        text: the start of a destination name(a string).
+        """
+
+        # Find where names starting with text begin in the sorted index, and
+        # take names from there for as long as they start with text.
+        key = normalise(text)
+        found = []
+        j = bisect_left(self.__index, (key,))
+        while j < len(self.__index) and self.__index[j][0].startswith(key):
+            found.append(self.__index[j][1])
+            j += 1
+        return found
+
+    def __len__(self):
+        """
+        Method that returns the number of destinations in the catalogue.
+        """
+        return len(self.__names)
+
+    def __spelling(self, name):
+        """
+        Method that returns the tuple (name, id) kept for the way name is
+        written, adding the destination to the catalogue if it is new.
+        """
+
+        # A tuple is only put in the dictionary once the destination has been
+        # added, so a name found without the lock is always complete. Only
+        # names that are strings are remembered.
+        found = self.__spellings.get(name) if isinstance(name, str) else None
+        if found is not None:
+            return found
+
+        with self.__lock:
+
+            # If the normalised name is new, give the destination the next id.
+            # Its name is added before its id, so any id that can be found
+            # already has its name.
+            key = normalise(name)
+            if key not in self.__ids:
+                self.__names.append(" ".join(str(name).split()))
+                insort(self.__index, (key, len(self.__names) - 1))
+                self.__ids[key] = len(self.__names) - 1
+
+            # Forget the ways of writing destinations if there are too many.
+            found = (name, self.__ids[key])
+            if isinstance(name, str):
+                if len(self.__spellings) >= self.__max_spellings:
+                    self.__spellings = {}
+                self.__spellings[name] = found
+            return found
+
+
+# The catalogue shared by all trips and schedules.
+catalogue = DestinationCatalogue()
@@ -0,0 +1,393 @@
+"""
+Author: Davis Nguyen
+
+ScheduleJournal class keeps an append-only journal of the changes made
+to a trip schedule, so the schedule can be recovered if the program stops.
+
+Note: The journal is made of two files. The journal file holds one line
+for each change, and the snapshot file (the journal path followed by
+".snapshot") holds the whole schedule as of its last compaction. To
+recover, the snapshot is loaded and only the changes made after it are
+replayed, so recovering takes time in proportion to the recent changes
+rather than to the size of the schedule.
+"""
+
+# Import the json, os, threading, and time modules for writing the journal,
+# and the chain function for going through several lists of trips.
+import json
+import os
+import threading
+import time
+from itertools import chain
+
+# Import the Date, Trip, RecurringTrip, and TripSchedule classes.
+from date import Date
+from trip import Trip
+from recurrence import RecurringTrip
+from tripschedule import TripSchedule
+
+def _trip_record(trip):
+    """
+    Function that returns a trip, or a recurring trip, as a list of values
+    that can be saved as JSON.
+    """
+    dep = trip.departure()
+    record = [trip.destination(), dep.month(), dep.day(), dep.year(), trip.duration()]
+    if isinstance(trip, RecurringTrip):
+        record += [trip.interval(), trip.count()]
+    return record
+
+def _record_trip(record):
+    """
+    Function that returns the Trip object, or RecurringTrip object if it has
+    an interval and count, saved in a list of values.
+    """
+    destination, month, day, year, duration = record[:5]
+    if len(record) > 5:
+        return RecurringTrip(destination, Date(month, day, year), duration, record[5], record[6])
+    return Trip(destination, Date(month, day, year), duration)
+
+def _read_lines(path):
+    """
+    Function that returns the records saved in a file, one per line, along
+    with the length of the file up to the end of the last whole record. A
+    line cut short by the program stopping partway through writing it is
+    left out.
+    """
+    records = []
+    length = 0
+    if not os.path.exists(path):
+        return records, length
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+            length += len(line)
+    return records, length
+
+def _sync_directory(path):
+    """
+    Function that makes sure the changes to the names of the files in the
+    directory holding path are saved on disk, such as a file being renamed.
+    Windows cannot open a directory to do this, so nothing is done there.
+    """
+    if os.name != "posix":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class ScheduleJournal:
+    """
+    Class called "ScheduleJournal" that records the changes made to a trip
+    schedule in a file and recovers the schedule from it.
+    """
+
+    def __init__(self, path, sync_every=100, sync_interval=1.0):
+        """
+        Constructor that opens the journal at a given path. Changes are held
+        in memory and written to disk together, once sync_every changes are
+        waiting or sync_interval seconds have passed since the first of them
+        was made, whichever comes first. A timer running in the background
+        writes the changes once sync_interval is up, even if no more changes
+        are made.
+
+        path: the path of the journal file(a string).
+        sync_every: the most changes to hold before writing(integer >= 1).
+        sync_interval: the most seconds to wait before writing(a number).
+        """
+        self.__path = path
+        self.__snapshot_path = path + ".snapshot"
+        self.__sync_every = sync_every
+        self.__sync_interval = sync_interval
+
+        # The changes waiting to be written, the number of the last change,
+        # and the time the first of the waiting changes was made.
+        self.__pending = []
+        self.__seq = 0
+        self.__first_pending = None
+
+        # The timer that writes the waiting changes once sync_interval is up,
+        # and the lock that keeps it from writing while a change is made.
+        self.__timer = None
+        self.__lock = threading.Lock()
+
+        # The journal file is only opened once the schedule is recovered.
+        self.__file = None
+
+    def recover(self):
+        """
+        Method that returns the schedule saved in the journal as a
+        JournaledTripSchedule, which records its changes in this journal.
+        If nothing has been saved yet, the schedule is empty.
+        """
+
+        # Load the snapshot. Its first line holds the number of the last
+        # change it includes, and every other line holds a trip or a
+        # recurring trip.
+        snapshot = _read_lines(self.__snapshot_path)[0]
+        self.__seq = snapshot[0]["seq"] if snapshot else 0
+        trips = []
+        rules = []
+        for record in snapshot[1:]:
+            saved = _record_trip(record)
+            if isinstance(saved, RecurringTrip):
+                rules.append(saved)
+            else:
+                trips.append(saved)
+
+        # Replay the changes made after the snapshot on the lists of trips and
+        # recurring trips, rather than on the schedule, so that the schedule
+        # is only checked for conflicts once, at the end. Deleted trips are
+        # found by their departure day counts and left out at the end.
+        departures = {trip.departure().daycount(): trip for trip in trips}
+        deleted = set()
+        records, length = _read_lines(self.__path)
+        for record in records:
+            if record["seq"] <= self.__seq:
+                continue
+            if record["op"] == "insert":
+                trip = _record_trip(record["trip"])
+                trips.append(trip)
+                departures[trip.departure().daycount()] = trip
+            elif record["op"] == "delete":
+                trip = self.__find(departures, record["trip"])
+                deleted.add(id(trip))
+                del departures[trip.departure().daycount()]
+            elif record["op"] == "sort":
+                trips = [trip for trip in trips if id(trip) not in deleted]
+                deleted = set()
+                trips.sort(key=lambda trip: trip.departure().daycount())
+            elif record["op"] == "insert_recurring":
+                rules.append(_record_trip(record["trip"]))
+            elif record["op"] == "delete_recurring":
+                rules.remove(self.__find_recurring(rules, record["trip"]))
+            self.__seq = record["seq"]
+
+        # Build the schedule. TripSchedule's methods are called directly so
+        # the trips are not journaled a second time.
+        schedule = JournaledTripSchedule(self)
+        for rule in rules:
+            TripSchedule.insert_recurring(schedule, rule)
+        TripSchedule.extend(schedule, [trip for trip in trips if id(trip) not in deleted])
+
+        # Open the journal file to add new changes to the end of it, first
+        # cutting off any change that was only partly written.
+        self.__file = open(self.__path, "a")
+        self.__file.truncate(length)
+        return schedule
+
+    def record(self, op, trip=None):
+        """
+        Method that adds a change to the journal. The change is written to
+        disk when enough changes are waiting or enough time has passed.
+
+        op: the kind of change, "insert", "delete", "sort", "insert_recurring",
+        or "delete_recurring".
+        trip: the Trip or RecurringTrip object that was inserted or deleted.
+        """
+        with self.__lock:
+            self.__seq += 1
+            entry = {"seq": self.__seq, "op": op}
+            if trip is not None:
+                entry["trip"] = _trip_record(trip)
+            if not self.__pending:
+                self.__first_pending = time.monotonic()
+            self.__pending.append(json.dumps(entry) + "\n")
+
+            # Write the waiting changes if there are enough of them or if it
+            # has been long enough since the first of them was made. Otherwise
+            # make sure the timer will write them once sync_interval is up.
+            if len(self.__pending) >= self.__sync_every or \
+                    time.monotonic() - self.__first_pending >= self.__sync_interval:
+                self.__sync()
+            elif self.__timer is None:
+                self.__timer = threading.Timer(self.__sync_interval, self.sync)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+    def sync(self):
+        """
+        Method that writes all waiting changes to the journal file and makes
+        sure they are saved on disk.
+        """
+        with self.__lock:
+            self.__sync()
+
+    def compact(self, schedule):
+        """
+        Method that saves the whole schedule to the snapshot file and empties
+        the journal file, since the snapshot now includes all its changes.
+        The journal must have been recovered first.
+
+        schedule: the TripSchedule being journaled.
+        """
+        with self.__lock:
+
+            # If the journal file is not open, the journal has not been
+            # recovered, or has been closed, so raise an exception.
+            if self.__file is None:
+                raise Exception("Journal must be recovered before it is compacted.")
+            self.__sync()
+
+            # Write the snapshot to a temporary file first and then put it in
+            # place, so a crash never leaves a half-written snapshot behind.
+            # The directory is synced too, so the new snapshot is sure to be
+            # in place on disk before the journal is emptied.
+            temp_path = self.__snapshot_path + ".tmp"
+            with open(temp_path, "w") as f:
+                f.write(json.dumps({"seq": self.__seq}) + "\n")
+                for trip in chain(schedule.recurring(), schedule):
+                    f.write(json.dumps(_trip_record(trip)) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.__snapshot_path)
+            _sync_directory(self.__snapshot_path)
+
+            # Empty the journal file. If the program stops before this, the old
+            # changes are skipped on recovery since the snapshot includes them.
+            self.__file.close()
+            self.__file = open(self.__path, "w")
+            os.fsync(self.__file.fileno())
+
+    def close(self):
+        """
+        Method that writes any waiting changes and closes the journal file.
+        """
+        with self.__lock:
+            if self.__file is not None:
+                self.__sync()
+                self.__file.close()
+                self.__file = None
+
+    def __sync(self):
+        """
+        Method that writes all waiting changes to the journal file while the
+        lock is held, and stops the timer since nothing is left waiting.
+        """
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if self.__pending and self.__file is not None:
+            self.__file.write("".join(self.__pending))
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__pending = []
+
+    def __find(self, departures, record):
+        """
+        Method that returns the trip matching a saved trip, out of a
+        dictionary of trips by the day counts of their departure dates.
+        """
+        saved = _record_trip(record)
+        trip = departures.get(saved.departure().daycount())
+        if trip is None or trip.destination() != saved.destination() or \
+                trip.duration() != saved.duration():
+            raise Exception("Journal deletes a trip that is not in the schedule.")
+        return trip
+
+    def __find_recurring(self, rules, record):
+        """
+        Method that returns the recurring trip in a list matching a saved
+        recurring trip.
+        """
+        for rule in rules:
+            if _trip_record(rule) == record:
+                return rule
+        raise Exception("Journal deletes a recurring trip that is not in the schedule.")
+
+
+class JournaledTripSchedule(TripSchedule):
+    """
+    Class called "JournaledTripSchedule" that is a trip schedule which
+    records every change made to it in a ScheduleJournal. It is made with
+    the recover method of ScheduleJournal.
+    """
+
+    def __init__(self, journal):
+        """
+        Constructor that creates an empty trip schedule recording its changes
+        in a journal.
+
+        journal: the ScheduleJournal to record changes in.
+        """
+        super().__init__()
+        self.__journal = journal
+
+    def insert(self, new_trip):
+        """
+        Method that adds a new trip to the schedule and records it.
+
+        new_trip: a Trip object to be added to the trip schedule.
+        """
+        super().insert(new_trip)
+        self.__journal.record("insert", new_trip)
+
+    def extend(self, new_trips):
+        """
+        Method that adds many new trips to the schedule at once and records
+        each of them.
+
+        new_trips: a list of Trip objects to be added to the trip schedule.
+        """
+        new_trips = list(new_trips)
+        super().extend(new_trips)
+        for new_trip in new_trips:
+            self.__journal.record("insert", new_trip)
+
+    def apply(self, changeset):
+        """
+        Method that makes the changes in a changeset to the schedule and
+        records each trip removed and added. The trips removed are recorded
+        as they were kept in the schedule, and are returned.
+
+        changeset: a Changeset, such as one returned by diff.
+        """
+        removed = super().apply(changeset)
+        for trip in removed:
+            self.__journal.record("delete", trip)
+        for trip in changeset.added() + [new for old, new in changeset.changed()]:
+            self.__journal.record("insert", trip)
+        return removed
+
+    def delete(self, trip):
+        """
+        Method that deletes a trip from the schedule and records it.
+
+        trip: a Trip object in the schedule to be removed.
+        """
+        super().delete(trip)
+        self.__journal.record("delete", trip)
+
+    def insert_recurring(self, rule):
+        """
+        Method that adds a recurring trip to the schedule and records it.
+
+        rule: a RecurringTrip object to be added to the trip schedule.
+        """
+        super().insert_recurring(rule)
+        self.__journal.record("insert_recurring", rule)
+
+    def delete_recurring(self, rule):
+        """
+        Method that deletes a recurring trip from the schedule and records it.
+
+        rule: a RecurringTrip object in the schedule to be removed.
+        """
+        super().delete_recurring(rule)
+        self.__journal.record("delete_recurring", rule)
+
+    def sortbydeparture(self):
+        """
+        Method that sorts the trips in the schedule by departure date and
+        records it.
+        """
+        super().sortbydeparture()
+        self.__journal.record("sort")
@@ -0,0 +1,118 @@
+"""
+Author: Davis Nguyen
+
+TripPacker class uses Trip class and TripSchedule class to choose the
+best set of trips to take out of more requested trips than one person
+can travel on.
+
+Note: The trips chosen follow the same rules as TripSchedule.insert: no
+two trips overlap, and no trip departs on the day another one arrives.
+Both methods take O(n log n) time for n candidate trips.
+"""
+
+# Import the bisect function for finding earlier trips.
+from bisect import bisect_left
+
+# Import the TripList class.
+from tripstore import TripList
+
+class TripPacker:
+    """
+    Class called "TripPacker" that chooses the largest, or most valuable,
+    set of candidate trips that can all be taken.
+    """
+
+    def __init__(self, schedule=None):
+        """
+        Constructor that creates a packer. If a schedule is given, only
+        candidates that fit around the trips already in it are chosen.
+
+        schedule: a TripSchedule, or None to start from an empty schedule.
+        """
+        self.__schedule = schedule
+
+    def most_trips(self, candidates):
+        """
+        Method that returns a list of the largest number of candidate trips
+        that can all be taken, sorted by departure date.
+
+        candidates: a list of Trip objects.
+        """
+
+        # Going through the candidates in order of arrival, take each one
+        # that departs after the last trip taken arrives. Taking the trip
+        # that is back first always leaves the most room for the rest.
+        chosen = []
+        last_arrival = -1
+        for departure, arrival, trip in self.__sorted_by_arrival(candidates):
+            if departure > last_arrival:
+                chosen.append(trip)
+                last_arrival = arrival
+
+        return chosen
+
+    def most_value(self, candidates, values):
+        """
+        Method that returns a list of the candidate trips that can all be
+        taken and have the largest total value, sorted by departure date.
+
+        candidates: a list of Trip objects.
+        values: a list of the value of each candidate trip(numbers).
+        """
+
+        # If there is not exactly one value for each candidate, raise an exception.
+        candidates = list(candidates)
+        if len(values) != len(candidates):
+            raise Exception("Number of values does not match number of candidates.")
+
+        trips = self.__sorted_by_arrival(candidates, values)
+        arrivals = [arrival for departure, arrival, trip, value in trips]
+
+        # best[j] is the largest total value of the first j trips in order of
+        # arrival. Trip j is either left out, or taken along with the best
+        # choice of the trips that arrive before it departs.
+        best = [0] * (len(trips) + 1)
+        for j, (departure, arrival, trip, value) in enumerate(trips):
+            earlier = bisect_left(arrivals, departure, 0, j)
+            best[j + 1] = max(best[j], best[earlier] + value)
+
+        # Go back through the trips to find which ones were taken.
+        chosen = []
+        j = len(trips)
+        while j > 0:
+            departure, arrival, trip, value = trips[j - 1]
+            earlier = bisect_left(arrivals, departure, 0, j - 1)
+            if best[j] == best[earlier] + value and best[j] != best[j - 1]:
+                chosen.append(trip)
+                j = earlier
+            else:
+                j -= 1
+
+        chosen.reverse()
+        return chosen
+
+    def __sorted_by_arrival(self, candidates, values=None):
+        """
+        Method that returns a list of tuples (departure, arrival, trip), with
+        the value of the trip added if values are given, for the candidates
+        that fit around the schedule, sorted by arrival.
+        """
+        candidates = TripList(candidates)
+        intervals = candidates.intervals()
+
+        # If there is a schedule, leave out the candidates that conflict with it.
+        fits = [True] * len(candidates)
+        if self.__schedule is not None:
+            fits = [accepted for accepted, reason in self.__schedule.feasible(candidates)]
+
+        trips = []
+        for j, trip in enumerate(candidates):
+            if fits[j]:
+                departure, arrival = intervals[j]
+                if values is None:
+                    trips.append((departure, arrival, trip))
+                else:
+                    trips.append((departure, arrival, trip, values[j]))
+
+        trips.sort(key=lambda item: (item[1], item[0]))
+        return trips
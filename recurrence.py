@@ -0,0 +1,206 @@
+"""
+Author: Davis Nguyen
+
+RecurringTrip class uses Date class and Trip class to describe a trip
+that repeats at a regular interval, such as a visit every second Monday.
+
+Note: A recurring trip is stored as a rule rather than as a list of
+trips. Each trip it stands for(an occurrence) is only made when it is
+asked for, and conflicts with other trips are found by arithmetic on day
+counts(see Date.daycount) rather than by looking at every occurrence.
+"""
+
+# Import the Date and Trip classes, the conflict function, and the
+# catalogue of destinations.
+from date import Date
+from trip import Trip, conflict
+from destination import catalogue
+
+class RecurringTrip:
+    """
+    Class called "RecurringTrip" that keeps track of a trip to the same
+    destination that repeats a given number of times at a regular interval.
+    """
+
+    def __init__(self, destination, depdate, duration, interval, count):
+        """
+        Constructor that initializes the recurring trip. For example, a
+        3 day trip every second Monday, 10 times, departing first on a
+        Monday depdate, has duration 3, interval 14, and count 10.
+
+        destination: the destination city of the trips(a string).
+        depdate: the departure date of the first trip(Date object).
+        duration: the duration of each trip(integer >= 1).
+        interval: the number of days from one departure to the next(integer).
+        count: the number of times the trip happens(integer >= 1).
+        """
+
+        # If the interval is not a positive number of days, raise an exception.
+        if interval < 1:
+            raise Exception("Invalid Interval")
+
+        # If a trip would not be back before the next one departs, the trips
+        # would conflict with each other, so raise an exception. A trip that
+        # only happens once cannot conflict with itself.
+        if interval <= duration and count > 1:
+            raise Exception("Recurring trips overlap.")
+
+        # If the trip does not happen at least once, raise an exception.
+        if count < 1:
+            raise Exception("Invalid Count")
+
+        self.__dest, self.__dest_id = catalogue.entry(destination)
+        self.__start = depdate.daycount()
+        self.__dur = duration
+        self.__interval = interval
+        self.__count = count
+
+    def destination(self):
+        """
+        Method that returns the destination of the trips.
+        """
+        return self.__dest
+
+    def destination_id(self):
+        """
+        Method that returns the id of the destination in the catalogue of
+        destinations.
+        """
+        return self.__dest_id
+
+    def departure(self):
+        """
+        Method that returns the departure date of the first trip.
+        """
+        return Date.fromdaycount(self.__start)
+
+    def duration(self):
+        """
+        Method that returns the duration of each trip.
+        """
+        return self.__dur
+
+    def interval(self):
+        """
+        Method that returns the number of days from one departure to the next.
+        """
+        return self.__interval
+
+    def count(self):
+        """
+        Method that returns the number of times the trip happens.
+        """
+        return self.__count
+
+    def occurrence(self, k):
+        """
+        Method that returns the k-th trip of the recurring trip as a Trip
+        object, counting from 0.
+
+        k: an integer between 0 and count - 1.
+        """
+
+        # Raise an index error if k is not one of the trips.
+        if k < 0 or k >= self.__count:
+            raise IndexError
+
+        return Trip(self.__dest, Date.fromdaycount(self.__start + k * self.__interval), self.__dur)
+
+    def occurrences(self, first=None, last=None):
+        """
+        Method that returns an iterator over the trips of the recurring trip
+        that are travelling on any day from the day count first to the day
+        count last. The trips are only made as the iterator reaches them.
+
+        first: a day count, or None to start from the first trip.
+        last: a day count, or None to go on to the last trip.
+        """
+        lo, hi = self.__range(first, last)
+        for k in range(lo, hi + 1):
+            yield self.occurrence(k)
+
+    def departing(self, first, last):
+        """
+        Method that returns an iterator over the trips of the recurring trip
+        that depart on any day from the day count first to the day count
+        last. The trips are found by arithmetic, so only those trips are made.
+
+        first: a day count.
+        last: a day count.
+        """
+
+        # Trip k departs on start + k * interval, so find the smallest k
+        # departing on or after first and the largest departing on or before last.
+        lo = max(0, -((self.__start - first) // self.__interval))
+        hi = min(self.__count - 1, (last - self.__start) // self.__interval)
+        for k in range(lo, hi + 1):
+            yield self.occurrence(k)
+
+    def conflict(self, departure, arrival):
+        """
+        Method that returns the reason a trip conflicts with the recurring
+        trip, or None if it does not.
+
+        departure: the day count of the trip's departure date.
+        arrival: the day count of the trip's arrival date.
+        """
+
+        # Only the first trip travelling during the other trip needs to be
+        # checked, since every trip in the range conflicts with it.
+        lo, hi = self.__range(departure, arrival)
+        if lo > hi:
+            return None
+        start = self.__start + lo * self.__interval
+        return conflict(start, start + self.__dur, departure, arrival)
+
+    def conflict_recurring(self, other):
+        """
+        Method that returns the reason two recurring trips conflict, or None
+        if they do not. Each trip of the recurring trip with fewer trips is
+        checked against the other by arithmetic.
+
+        other: a second RecurringTrip.
+        """
+        if other.__count < self.__count:
+            return other.conflict_recurring(self)
+        for k in range(self.__count):
+            start = self.__start + k * self.__interval
+            reason = other.conflict(start, start + self.__dur)
+            if reason is not None:
+                return reason
+        return None
+
+    def __range(self, first, last):
+        """
+        Method that returns the numbers of the first and last trips travelling
+        on any day from the day count first to the day count last. If there
+        are no such trips, the first number is larger than the last.
+        """
+
+        # Trip k travels from start + k * interval to start + k * interval +
+        # duration, so find the smallest k that arrives on or after first and
+        # the largest k that departs on or before last.
+        lo = 0
+        hi = self.__count - 1
+        if first is not None:
+            lo = max(lo, -((self.__start + self.__dur - first) // self.__interval))
+        if last is not None:
+            hi = min(hi, (last - self.__start) // self.__interval)
+        return lo, hi
+
+    def __str__(self):
+        """
+        Method that returns the recurring trip details in a neatly formatted way.
+        """
+        destination = "Destination: " + self.destination() + "\n"
+        duration = "Duration: " + str(self.duration()) + " days\n"
+        first = "First Departure: {}, {}\n".format(self.departure().day_of_week(), self.departure())
+        repeats = "Repeats: every {} days, {} times\n".format(self.interval(), self.count())
+
+        return destination + duration + first + repeats
+
+    def __repr__(self):
+        """
+        Method that returns a suitable string representation of the recurring trip.
+        """
+        return str(self)
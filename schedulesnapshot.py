@@ -0,0 +1,328 @@
+"""
+Author: Davis Nguyen
+
+ScheduleSnapshot class is a frozen, read-only view of a trip schedule
+at one moment in time, which can be used for things such as reports
+that run while the schedule keeps changing.
+
+Note: Snapshots share unchanged parts with the live schedule and with
+each other, so taking one is cheap and each change to the schedule only
+costs a few new tree nodes. The Trip objects themselves are shared too,
+so a trip must not be changed with its set methods while it is in a
+snapshot.
+
+Taking a snapshot takes O(1) time, and each insert or delete takes
+O(log N) time to follow, with two exceptions that take O(N) time: the
+first snapshot of a schedule, which builds the tree, and sorting the
+schedule, which builds a new tree for the new order that shares nothing
+with the old one and takes O(N log N) time.
+"""
+
+# Import the random module for the tree node priorities, and the weakref
+# module for keeping track of the snapshots still in use.
+import random
+import weakref
+
+# The smallest number of changes the log holds before old changes no
+# snapshot needs are thrown away.
+_PRUNE_MIN = 64
+
+# The trips of a snapshot are kept in a persistent tree ordered by position
+# in the schedule. Each node is a tuple (trip, priority, size, left, right),
+# and a node is never changed after it is made; a change makes new copies
+# of the nodes on the path to it and shares everything else. Priorities
+# keep the tree balanced, since a node's priority is always higher than
+# its children's.
+
+def _size(node):
+    """
+    Function that returns the number of trips in the tree node.
+    """
+    return node[2] if node else 0
+
+def _node(trip, priority, left, right):
+    """
+    Function that returns a new tree node with the given children.
+    """
+    return (trip, priority, _size(left) + _size(right) + 1, left, right)
+
+def _merge(left, right):
+    """
+    Function that returns a tree with the trips of left followed by the
+    trips of right.
+    """
+    if not left:
+        return right
+    if not right:
+        return left
+    if left[1] > right[1]:
+        return _node(left[0], left[1], left[3], _merge(left[4], right))
+    return _node(right[0], right[1], _merge(left, right[3]), right[4])
+
+def _split(node, k):
+    """
+    Function that splits a tree into the first k trips and the rest.
+    """
+    if not node:
+        return None, None
+    left_size = _size(node[3])
+    if k <= left_size:
+        left, right = _split(node[3], k)
+        return left, _node(node[0], node[1], right, node[4])
+    left, right = _split(node[4], k - left_size - 1)
+    return _node(node[0], node[1], node[3], left), right
+
+def _build(trips, lo, hi):
+    """
+    Function that builds a balanced tree from trips[lo:hi]. Each node gets
+    a priority above the priorities of all the nodes below it.
+    """
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    left = _build(trips, lo, mid)
+    right = _build(trips, mid + 1, hi)
+
+    # The priority is the height of the node plus a random fraction.
+    height = max(int(left[1]) + 1 if left else 0, int(right[1]) + 1 if right else 0)
+    return _node(trips[mid], height + random.random(), left, right)
+
+def _walk(node):
+    """
+    Function that returns an iterator over the trips in a tree, in order.
+    """
+    stack = []
+    while stack or node:
+
+        # Go as far left as possible, then return the trip and move on
+        # to the right subtree.
+        while node:
+            stack.append(node)
+            node = node[3]
+        node = stack.pop()
+        yield node[0]
+        node = node[4]
+
+
+class ScheduleHistory:
+    """
+    Class called "ScheduleHistory" that follows the changes made to a trip
+    schedule so that snapshots of it can be taken at any time.
+    """
+
+    def __init__(self, trips):
+        """
+        Constructor that starts following a schedule holding the given trips.
+
+        trips: a list of the Trip objects in the schedule, in order.
+        """
+
+        # The tree of the current trips and the number of changes.
+        self.__root = _build(trips, 0, len(trips))
+        self.__version = 0
+
+        # The log of changes, as tuples (action, trip), where entry i is
+        # change number start + i + 1. Changes made before the oldest
+        # snapshot still in use are thrown away once the log holds more
+        # than prune_at changes, so deleted trips are not kept forever.
+        self.__log = []
+        self.__start = 0
+        self.__prune_at = _PRUNE_MIN
+
+        # The snapshots still in use. They are held weakly, so a snapshot
+        # that is no longer used elsewhere is removed by itself.
+        self.__snapshots = weakref.WeakSet()
+
+    def inserted(self, trip):
+        """
+        Method that records a trip added to the end of the schedule.
+
+        trip: the Trip object that was added.
+        """
+        self.__root = _merge(self.__root, _node(trip, random.random(), None, None))
+        self.__record("insert", trip)
+
+    def deleted(self, j):
+        """
+        Method that records the trip at an index being removed from the
+        schedule. The trip logged is the one in the tree, so it is the same
+        object that earlier snapshots hold.
+
+        j: the index the trip had in the schedule.
+        """
+        left, rest = _split(self.__root, j)
+        middle, right = _split(rest, 1)
+        self.__root = _merge(left, right)
+        self.__record("delete", middle[0])
+
+    def reordered(self):
+        """
+        Method that records the trips of the schedule being sorted by
+        departure date. The same trips remain, so no change is logged. The
+        trips already in the tree are sorted the same way as the schedule,
+        rather than taken from it again, so they stay the same objects that
+        earlier snapshots and the log hold even when the schedule makes new
+        Trip objects, as a CompactTripStore does. The tree is built again,
+        which takes O(N log N) time.
+        """
+        trips = sorted(_walk(self.__root), key=lambda trip: trip.departure().daycount())
+        self.__root = _build(trips, 0, len(trips))
+
+    def snapshot(self):
+        """
+        Method that returns a ScheduleSnapshot of the schedule as it is now.
+        """
+        snapshot = ScheduleSnapshot(self.__root, self.__version, self)
+        self.__snapshots.add(snapshot)
+        return snapshot
+
+    def changes(self, first, last):
+        """
+        Method that returns a list of the changes made after version first up
+        to version last, oldest first, as tuples (action, trip).
+
+        first: the version of a snapshot still in use.
+        last: a later version.
+        """
+        return self.__log[first - self.__start:last - self.__start]
+
+    def __record(self, action, trip):
+        """
+        Method that adds a change to the log, throwing away old changes if
+        the log has grown long enough.
+        """
+        self.__log.append((action, trip))
+        self.__version += 1
+        if len(self.__log) > self.__prune_at:
+            self.__prune()
+
+    def __prune(self):
+        """
+        Method that throws away the changes made before the oldest snapshot
+        still in use. The log is allowed to grow to twice its new length
+        before this is done again, so each change costs O(1) time on average.
+        """
+        oldest = min((snapshot.version() for snapshot in list(self.__snapshots)),
+                     default=self.__version)
+        del self.__log[:oldest - self.__start]
+        self.__start = oldest
+        self.__prune_at = max(_PRUNE_MIN, 2 * len(self.__log))
+
+
+class ScheduleSnapshot:
+    """
+    Class called "ScheduleSnapshot" that is an immutable view of a trip
+    schedule at the moment the snapshot was taken.
+    """
+
+    def __init__(self, root, version, history):
+        """
+        Constructor that creates a snapshot. Snapshots are made with the
+        snapshot method of TripSchedule rather than directly.
+
+        root: the tree of the trips in the snapshot.
+        version: the number of changes made before the snapshot.
+        history: the ScheduleHistory the snapshot was taken from.
+        """
+        self.__root = root
+        self.__version = version
+        self.__history = history
+
+    def version(self):
+        """
+        Method that returns the number of changes made to the schedule
+        before the snapshot was taken.
+        """
+        return self.__version
+
+    def diff(self, other):
+        """
+        Method that returns the changes between this snapshot and a later
+        snapshot other, as a tuple of two lists: the trips added and the
+        trips removed. If other is the earlier snapshot, the two lists are
+        swapped accordingly.
+
+        When both snapshots come from the same schedule, only the changes
+        made between them are looked at. Otherwise the trips of both
+        snapshots are compared.
+
+        other: a second ScheduleSnapshot.
+        """
+
+        # If the snapshots come from different schedules, compare every trip.
+        if self.__history is not other.__history:
+            old_ids = set(map(id, self))
+            new_ids = set(map(id, other))
+            added = [trip for trip in other if id(trip) not in old_ids]
+            removed = [trip for trip in self if id(trip) not in new_ids]
+            return added, removed
+
+        # If the other snapshot is the earlier one, find the changes the
+        # other way round and swap the added and removed trips.
+        if other.__version < self.__version:
+            removed, added = other.diff(self)
+            return added, removed
+
+        # Go through the changes made between the snapshots, oldest first,
+        # and count how many times each trip was inserted minus the times it
+        # was deleted.
+        counts = {}
+        for action, trip in self.__history.changes(self.__version, other.__version):
+            count = counts.get(id(trip), (trip, 0))[1]
+            counts[id(trip)] = (trip, count + 1 if action == "insert" else count - 1)
+
+        added = [trip for trip, count in counts.values() if count > 0]
+        removed = [trip for trip, count in counts.values() if count < 0]
+        return added, removed
+
+    def __len__(self):
+        """
+        Method that returns the number of trips in the snapshot.
+        """
+        return _size(self.__root)
+
+    def __getitem__(self, j):
+        """
+        Method that returns the j-th trip in the snapshot.
+
+        j: an index value, which may be negative to count from the end.
+        """
+
+        # Turn a negative index into one counted from the start, and raise
+        # an index error if j is out of range.
+        if j < 0:
+            j += len(self)
+        if j < 0 or j >= len(self):
+            raise IndexError
+
+        # Walk down the tree, using the sizes of the left subtrees to find
+        # which way the j-th trip is.
+        node = self.__root
+        while True:
+            left_size = _size(node[3])
+            if j < left_size:
+                node = node[3]
+            elif j == left_size:
+                return node[0]
+            else:
+                j -= left_size + 1
+                node = node[4]
+
+    def __iter__(self):
+        """
+        Method that returns an iterator over the trips in the snapshot, in
+        schedule order.
+        """
+        return _walk(self.__root)
+
+    def __str__(self):
+        """
+        Method that returns a string representation of the snapshot.
+        """
+        return "\n".join(map(str, self))
+
+    def __repr__(self):
+        """
+        Method that returns a suitable string representation of the snapshot.
+        """
+        return str(self)
@@ -0,0 +1,141 @@
+"""
+Author: Davis Nguyen
+
+Stress test for ConcurrentTripSchedule, which runs threads that change a
+shared schedule alongside threads that query it, and checks that no query
+ever sees the schedule in an inconsistent state.
+"""
+
+# Import the threading and unittest modules.
+import threading
+import unittest
+
+# Import the Date, Trip, and ConcurrentTripSchedule classes.
+from date import Date
+from trip import Trip
+from concurrentschedule import ConcurrentTripSchedule
+
+# Number of threads changing the schedule, number of threads reading it,
+# and number of trips each writer inserts.
+WRITERS = 4
+READERS = 4
+TRIPS_PER_WRITER = 150
+
+def writer_trips(w):
+    """
+    Function that returns the trips inserted by writer w. Each writer has a
+    year of its own, so the writers never conflict with each other.
+    """
+    start = Date(1, 1, 2000 + w)
+    return [Trip("City {}".format(w), start + 2 * k, 1) for k in range(TRIPS_PER_WRITER)]
+
+
+class ConcurrentTripScheduleTest(unittest.TestCase):
+    """
+    Class called "ConcurrentTripScheduleTest" that tests a ConcurrentTripSchedule
+    being changed and queried by many threads at once.
+    """
+
+    def setUp(self):
+        """
+        Method that creates a schedule holding one trip that is never removed.
+        """
+        self.schedule = ConcurrentTripSchedule()
+        self.anchor = Trip("Anchor", Date(6, 1, 1999), 3)
+        self.schedule.insert(self.anchor)
+        self.errors = []
+
+    def check_trips(self, trips):
+        """
+        Method that checks a list of trips read from the schedule: the anchor
+        trip is there, no two trips overlap or turn around on the same day,
+        and there are no more trips than the writers could have inserted.
+        """
+        self.assertIn("Anchor", [trip.destination() for trip in trips])
+        self.assertLessEqual(len(trips), 1 + WRITERS * TRIPS_PER_WRITER)
+        intervals = sorted((trip.departure().daycount(), trip.arrival().daycount()) for trip in trips)
+        for i in range(1, len(intervals)):
+            self.assertGreater(intervals[i][0], intervals[i-1][1])
+
+    def writer(self, w):
+        """
+        Method run by each writer thread: insert the writer's trips one at a
+        time, delete every second one, and sort the schedule now and then.
+        """
+        try:
+            trips = writer_trips(w)
+            for k, trip in enumerate(trips):
+                self.schedule.insert(trip)
+                if k % 25 == 0:
+                    self.schedule.sortbydeparture()
+            for trip in trips[::2]:
+                self.schedule.delete(trip)
+        except Exception as e:
+            self.errors.append(e)
+
+    def reader(self, done):
+        """
+        Method run by each reader thread: until the writers are done, iterate
+        over the schedule and ask it which trips are feasible and which days
+        are free, checking each answer.
+        """
+        try:
+            clash = Trip("Clash", Date(6, 2, 1999), 1)
+            free = Trip("Free", Date(6, 1, 1998), 1)
+            while not done.is_set():
+                self.check_trips(list(self.schedule))
+
+                # The trip clashing with the anchor is always rejected, and
+                # the trip in a year no writer uses is always accepted.
+                self.assertEqual(self.schedule.feasible([clash, free]),
+                                 [(False, "Trips overlap."), (True, None)])
+
+                # The anchor's days are never free, and the free days of a
+                # month are in order with no repeats.
+                june = [date.day() for date in self.schedule.available(6, 1999)]
+                self.assertEqual(june, sorted(set(june)))
+                self.assertFalse({1, 2, 3, 4} & set(june))
+                self.assertEqual(len(june), 26)
+                busy = self.schedule.available(1, 2000 + WRITERS - 1)
+                self.assertLessEqual(len(busy), 31)
+        except Exception as e:
+            self.errors.append(e)
+
+    def test_concurrent_inserts_and_queries(self):
+        """
+        Method that runs the writers and readers together, and then checks
+        that the schedule holds exactly the trips that were not deleted.
+        """
+        done = threading.Event()
+        readers = [threading.Thread(target=self.reader, args=(done,)) for r in range(READERS)]
+        writers = [threading.Thread(target=self.writer, args=(w,)) for w in range(WRITERS)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(self.errors, [])
+        trips = list(self.schedule)
+        self.check_trips(trips)
+        self.assertEqual(len(trips), 1 + WRITERS * (TRIPS_PER_WRITER // 2))
+        self.assertEqual(len(self.schedule), len(trips))
+
+    def test_iterator_does_not_block_writers(self):
+        """
+        Method that checks an iterator taken from the schedule keeps the trips
+        it was taken with while a writer changes the schedule.
+        """
+        iterator = iter(self.schedule)
+        thread = threading.Thread(target=self.writer, args=(0,))
+        thread.start()
+        thread.join(timeout=30)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(list(iterator), [self.anchor])
+        self.assertEqual(len(self.schedule), 1 + TRIPS_PER_WRITER // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Author: Davis Nguyen
+
+Tests for DestinationCatalogue, which check that the ways of writing a
+destination are found as the same city, that destinations are found by
+the start of their names, and that trips keep the ids of their
+destinations.
+"""
+
+# Import the unittest module.
+import unittest
+
+# Import the DestinationCatalogue and Trip classes, the normalise function,
+# and the Date class.
+from destination import DestinationCatalogue, normalise
+from date import Date
+from trip import Trip
+
+
+class DestinationCatalogueTest(unittest.TestCase):
+    """
+    Class called "DestinationCatalogueTest" that tests the catalogue of
+    destinations.
+    """
+
+    def test_normalise(self):
+        """
+        Method that checks names are compared without regard to upper or
+        lower case or extra spaces.
+        """
+        self.assertEqual(normalise("  New   York "), "new york")
+        self.assertEqual(normalise("NEW\tYORK"), "new york")
+        self.assertEqual(normalise("Straße"), normalise("STRASSE"))
+        self.assertEqual(normalise(42), "42")
+
+    def test_same_city(self):
+        """
+        Method that checks the ways of writing a destination get the same id,
+        that the name kept is the first way it was written, and that each
+        way of writing it keeps its own string.
+        """
+        catalogue = DestinationCatalogue()
+        paris = catalogue.intern(" Paris ")
+        self.assertEqual(catalogue.intern("paris"), paris)
+        self.assertEqual(catalogue.intern("PARIS"), paris)
+        self.assertNotEqual(catalogue.intern("Lyon"), paris)
+        self.assertEqual(catalogue.name(paris), "Paris")
+        self.assertEqual(catalogue.spelling("paris"), "paris")
+        self.assertEqual(catalogue.entry("PARIS"), ("PARIS", paris))
+        self.assertEqual(catalogue.lookup("pArIs"), paris)
+        self.assertIsNone(catalogue.lookup("Rome"))
+        self.assertEqual(len(catalogue), 2)
+
+    def test_spellings_forgotten(self):
+        """
+        Method that checks a destination keeps its id after the ways of
+        writing destinations are forgotten.
+        """
+        catalogue = DestinationCatalogue(max_spellings=3)
+        ids = [catalogue.intern("City {}".format(k)) for k in range(10)]
+        self.assertEqual([catalogue.intern("city {}".format(k)) for k in range(10)], ids)
+        self.assertEqual([catalogue.lookup("CITY {}".format(k)) for k in range(10)], ids)
+        self.assertEqual(len(catalogue), 10)
+
+    def test_prefix(self):
+        """
+        Method that checks prefix finds the destinations whose names start
+        with some text, sorted by name, without regard to case or spaces.
+        """
+        catalogue = DestinationCatalogue()
+        for name in ["San Jose", "Santa Fe", "san  francisco", "Salem", "Boston", "San"]:
+            catalogue.intern(name)
+        names = lambda ids: [catalogue.name(destination_id) for destination_id in ids]
+        self.assertEqual(names(catalogue.prefix(" San  F")), ["san francisco"])
+        self.assertEqual(names(catalogue.prefix("SAN")), ["San", "san francisco", "San Jose", "Santa Fe"])
+        self.assertEqual(names(catalogue.prefix("Sa")), ["Salem", "San", "san francisco", "San Jose", "Santa Fe"])
+        self.assertEqual(catalogue.prefix("Seattle"), [])
+        self.assertEqual(len(catalogue.prefix("")), 6)
+
+    def test_trip_destination_ids(self):
+        """
+        Method that checks a trip keeps the id of its destination, including
+        after its destination is changed, and that a destination that is not
+        a string is accepted.
+        """
+        trip = Trip(" rome", Date(1, 1, 2024), 2)
+        self.assertEqual(trip.destination_id(), Trip("ROME", Date(2, 1, 2024), 1).destination_id())
+        trip.setDestination("Milan")
+        self.assertEqual(trip.destination(), "Milan")
+        self.assertEqual(trip.destination_id(), Trip("milan", Date(2, 1, 2024), 1).destination_id())
+
+        number = Trip(7, Date(1, 1, 2024), 2)
+        self.assertEqual(number.destination(), 7)
+        self.assertEqual(number.destination_id(), Trip("7", Date(2, 1, 2024), 1).destination_id())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+"""
+Author: Davis Nguyen
+
+Tests for ScheduleJournal, which check that a schedule recovered from the
+journal is the same as the schedule that was journaled, including after a
+compaction, a crash partway through a compaction, and a change that was
+only partly written.
+"""
+
+# Import the os, shutil, tempfile, and unittest modules.
+import os
+import shutil
+import tempfile
+import unittest
+
+# Import the Date, Trip, RecurringTrip, and ScheduleJournal classes.
+from date import Date
+from trip import Trip
+from recurrence import RecurringTrip
+from journal import ScheduleJournal
+
+def contents(schedule):
+    """
+    Function that returns the trips and recurring trips of a schedule as
+    lists of strings, so schedules can be compared.
+    """
+    return ([str(trip) for trip in schedule],
+            [(str(rule), rule.interval(), rule.count()) for rule in schedule.recurring()])
+
+
+class ScheduleJournalTest(unittest.TestCase):
+    """
+    Class called "ScheduleJournalTest" that tests recovering schedules from
+    a journal.
+    """
+
+    def setUp(self):
+        """
+        Method that makes a directory for the journal files.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "trips.journal")
+
+    def tearDown(self):
+        """
+        Method that removes the directory of journal files.
+        """
+        shutil.rmtree(self.directory)
+
+    def reopen(self):
+        """
+        Method that recovers the schedule from the journal files in a new
+        journal, as a program starting again would, and returns both.
+        """
+        journal = ScheduleJournal(self.path)
+        return journal, journal.recover()
+
+    def test_snapshot_and_tail(self):
+        """
+        Method that checks a schedule is recovered from a compaction along
+        with the changes made after it.
+        """
+        journal, schedule = self.reopen()
+        schedule.extend([Trip("City {}".format(k), Date(1, 1, 2024) + 10 * k, 2) for k in range(10)])
+        schedule.delete(schedule[4])
+        journal.compact(schedule)
+        schedule.insert(Trip("Late", Date(12, 1, 2023), 3))
+        schedule.delete(schedule[0])
+        schedule.sortbydeparture()
+        expected = contents(schedule)
+        journal.close()
+
+        journal, recovered = self.reopen()
+        self.assertEqual(contents(recovered), expected)
+        journal.close()
+
+    def test_crash_before_journal_emptied(self):
+        """
+        Method that checks the changes left in the journal by a crash after
+        the snapshot was put in place, but before the journal was emptied,
+        are skipped, along with any changes added after them.
+        """
+        journal, schedule = self.reopen()
+        schedule.extend([Trip("City", Date(1, 1, 2024) + 10 * k, 2) for k in range(5)])
+        schedule.delete(schedule[1])
+        journal.sync()
+        with open(self.path, "rb") as f:
+            stale = f.read()
+        journal.compact(schedule)
+        expected = contents(schedule)
+        journal.close()
+
+        # Put the changes the snapshot already includes back in the journal.
+        with open(self.path, "wb") as f:
+            f.write(stale)
+
+        journal, recovered = self.reopen()
+        self.assertEqual(contents(recovered), expected)
+        recovered.insert(Trip("Next", Date(6, 1, 2024), 1))
+        expected = contents(recovered)
+        journal.close()
+
+        journal, recovered = self.reopen()
+        self.assertEqual(contents(recovered), expected)
+        journal.close()
+
+    def test_torn_last_line(self):
+        """
+        Method that checks a change only partly written is left out and cut
+        off the end of the journal, so changes made afterwards are kept.
+        """
+        journal, schedule = self.reopen()
+        schedule.insert(Trip("City", Date(1, 1, 2024), 2))
+        expected = contents(schedule)
+        journal.close()
+        length = os.path.getsize(self.path)
+        with open(self.path, "ab") as f:
+            f.write(b'{"seq": 2, "op": "insert", "trip": ["Ci')
+
+        journal, recovered = self.reopen()
+        self.assertEqual(contents(recovered), expected)
+        self.assertEqual(os.path.getsize(self.path), length)
+        recovered.insert(Trip("Other", Date(2, 1, 2024), 2))
+        expected = contents(recovered)
+        journal.close()
+
+        journal, recovered = self.reopen()
+        self.assertEqual(contents(recovered), expected)
+        journal.close()
+
+    def test_delete_and_insert_same_day(self):
+        """
+        Method that checks a trip deleted and replaced by another departing
+        on the same day is recovered as the new trip, whether the old trip
+        came from the snapshot or the journal.
+        """
+        journal, schedule = self.reopen()
+        schedule.insert(Trip("Old", Date(3, 1, 2024), 2))
+        schedule.insert(Trip("Kept", Date(4, 1, 2024), 2))
+        schedule.delete(schedule[0])
+        schedule.insert(Trip("New", Date(3, 1, 2024), 5))
+        journal.compact(schedule)
+        schedule.delete(schedule[1])
+        schedule.insert(Trip("Newer", Date(3, 1, 2024), 1))
+        expected = contents(schedule)
+        journal.close()
+
+        journal, recovered = self.reopen()
+        self.assertEqual(contents(recovered), expected)
+        journal.close()
+
+    def test_recurring_trips(self):
+        """
+        Method that checks recurring trips inserted and deleted are recovered,
+        both from the snapshot and from the journal.
+        """
+        journal, schedule = self.reopen()
+        weekly = RecurringTrip("Office", Date(1, 1, 2024), 1, 7, 10)
+        monthly = RecurringTrip("Plant", Date(1, 3, 2024), 2, 28, 5)
+        schedule.insert_recurring(weekly)
+        schedule.insert_recurring(monthly)
+        journal.compact(schedule)
+        schedule.delete_recurring(weekly)
+        schedule.insert_recurring(RecurringTrip("Lab", Date(5, 1, 2024), 1, 14, 3))
+        schedule.insert(Trip("City", Date(6, 1, 2024), 2))
+        expected = contents(schedule)
+        journal.close()
+
+        journal, recovered = self.reopen()
+        self.assertEqual(contents(recovered), expected)
+        with self.assertRaises(Exception):
+            recovered.insert(Trip("Clash", Date(1, 3, 2024), 1))
+        journal.close()
+
+    def test_compact_before_recover(self):
+        """
+        Method that checks compacting a journal that has not been recovered
+        raises an exception saying so.
+        """
+        journal, schedule = self.reopen()
+        with self.assertRaises(Exception) as context:
+            ScheduleJournal(self.path).compact(schedule)
+        self.assertEqual(str(context.exception), "Journal must be recovered before it is compacted.")
+        journal.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
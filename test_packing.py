@@ -0,0 +1,138 @@
+"""
+Author: Davis Nguyen
+
+Tests for TripPacker, which check its choices against trying every set of
+candidates on small inputs, and check that it scales as O(n log n) on
+large ones. The test with 1,000,000 candidates only runs if the
+environment variable PACKING_1M is set, since it takes a while.
+"""
+
+# Import the itertools, os, random, time, and unittest modules.
+import itertools
+import os
+import random
+import time
+import unittest
+
+# Import the Date, Trip, TripSchedule, and TripPacker classes, and the
+# conflict function.
+from date import Date
+from trip import Trip, conflict
+from tripschedule import TripSchedule
+from packing import TripPacker
+
+START = Date(1, 1, 1900)
+
+def random_trips(count, span):
+    """
+    Function that returns count random trips departing within span days.
+    """
+    return [Trip("City", START + random.randrange(span), random.randint(1, 5)) for k in range(count)]
+
+def fits(trips):
+    """
+    Function that returns True if no two trips conflict with each other.
+    """
+    intervals = sorted((trip.departure().daycount(), trip.arrival().daycount()) for trip in trips)
+    return all(conflict(*intervals[i-1], *intervals[i]) is None for i in range(1, len(intervals)))
+
+
+class TripPackerTest(unittest.TestCase):
+    """
+    Class called "TripPackerTest" that tests the choices TripPacker makes.
+    """
+
+    def setUp(self):
+        """
+        Method that makes the random trips the same on every run.
+        """
+        random.seed(7)
+
+    def test_most_trips_and_value_are_best(self):
+        """
+        Method that checks most_trips and most_value against every set of
+        candidates, for many small random inputs.
+        """
+        for run in range(200):
+            candidates = random_trips(random.randint(0, 9), 30)
+            values = [random.randint(1, 10) for trip in candidates]
+            best_count = 0
+            best_value = 0
+            for r in range(len(candidates) + 1):
+                for chosen in itertools.combinations(range(len(candidates)), r):
+                    if fits([candidates[j] for j in chosen]):
+                        best_count = max(best_count, r)
+                        best_value = max(best_value, sum(values[j] for j in chosen))
+
+            packer = TripPacker()
+            chosen = packer.most_trips(candidates)
+            self.assertTrue(fits(chosen))
+            self.assertEqual(len(chosen), best_count)
+
+            chosen = packer.most_value(candidates, values)
+            self.assertTrue(fits(chosen))
+            self.assertEqual(sum(values[candidates.index(trip)] for trip in chosen), best_value)
+
+    def test_fits_around_schedule(self):
+        """
+        Method that checks the trips chosen fit around the trips of a schedule.
+        """
+        schedule = TripSchedule()
+        schedule.extend([Trip("Home", START + 10 * k, 2) for k in range(20)])
+        candidates = random_trips(300, 200)
+        for chosen in (TripPacker(schedule).most_trips(candidates),
+                       TripPacker(schedule).most_value(candidates, [1] * len(candidates))):
+            self.assertTrue(fits(chosen + list(schedule)))
+            self.assertTrue(all(ok for ok, reason in schedule.feasible(chosen)))
+
+    def test_values_must_match_candidates(self):
+        """
+        Method that checks most_value raises an exception when the number of
+        values is not the number of candidates.
+        """
+        candidates = random_trips(5, 30)
+        for values in ([1] * 4, [1] * 6):
+            with self.assertRaises(Exception) as context:
+                TripPacker().most_value(candidates, values)
+            self.assertEqual(str(context.exception),
+                             "Number of values does not match number of candidates.")
+
+    def check_scaling(self, sizes):
+        """
+        Method that packs random candidates of each size, checks the trips
+        chosen fit and that most_value with equal values takes as many trips
+        as most_trips, and checks that the time grows no faster than a
+        generous bound on n log n.
+        """
+        times = []
+        for size in sizes:
+            candidates = random_trips(size, 3 * size)
+            began = time.perf_counter()
+            by_count = TripPacker().most_trips(candidates)
+            by_value = TripPacker().most_value(candidates, [1] * size)
+            times.append(time.perf_counter() - began)
+            self.assertTrue(fits(by_count))
+            self.assertTrue(fits(by_value))
+            self.assertEqual(len(by_value), len(by_count))
+
+        # Going up 10 times in size should take about 12 times as long for
+        # O(n log n), and 100 times as long for O(n^2). Allow up to 40 times.
+        for i in range(1, len(sizes)):
+            self.assertLess(times[i], 4 * times[i-1] * sizes[i] / sizes[i-1])
+
+    def test_scaling(self):
+        """
+        Method that checks scaling from 1,000 to 100,000 candidates.
+        """
+        self.check_scaling([1000, 10000, 100000])
+
+    @unittest.skipUnless(os.environ.get("PACKING_1M"), "set PACKING_1M to run")
+    def test_scaling_1m(self):
+        """
+        Method that checks scaling from 100,000 to 1,000,000 candidates.
+        """
+        self.check_scaling([100000, 1000000])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Author: Davis Nguyen
+
+Tests for RecurringTrip, which check the trips and conflicts it finds by
+arithmetic against making every one of its trips and checking them one by
+one, and check the recurring trips that are not allowed.
+"""
+
+# Import the contextlib, io, random, and unittest modules.
+import contextlib
+import io
+import random
+import unittest
+
+# Import the Date, Trip, RecurringTrip, and TripSchedule classes, and the
+# conflict function.
+from date import Date
+from trip import Trip, conflict
+from recurrence import RecurringTrip
+from tripschedule import TripSchedule
+
+START = Date(1, 1, 2020).daycount()
+
+def random_rule():
+    """
+    Function that returns a random recurring trip, which happens only once
+    about one time in five.
+    """
+    duration = random.randint(1, 5)
+    count = 1 if random.random() < 0.2 else random.randint(2, 12)
+    interval = random.randint(duration + 1, 20) if count > 1 else random.randint(1, 20)
+    return RecurringTrip("Office", Date.fromdaycount(START + random.randrange(60)),
+                         duration, interval, count)
+
+def expand(rule):
+    """
+    Function that returns a list of (departure, arrival) day counts for
+    every trip of a recurring trip.
+    """
+    start = rule.departure().daycount()
+    return [(start + k * rule.interval(), start + k * rule.interval() + rule.duration())
+            for k in range(rule.count())]
+
+def first_conflict(intervals, departure, arrival):
+    """
+    Function that returns the reason the first of the intervals to conflict
+    with a trip does, or None if none of them do.
+    """
+    for start, end in intervals:
+        reason = conflict(start, end, departure, arrival)
+        if reason is not None:
+            return reason
+    return None
+
+def days(trips):
+    """
+    Function that returns a list of (departure, arrival) day counts for trips.
+    """
+    return [(trip.departure().daycount(), trip.arrival().daycount()) for trip in trips]
+
+
+class RecurringTripTest(unittest.TestCase):
+    """
+    Class called "RecurringTripTest" that tests RecurringTrip against
+    expanding every one of its trips.
+    """
+
+    def setUp(self):
+        """
+        Method that makes the random recurring trips the same on every run.
+        """
+        random.seed(3)
+
+    def test_trips_in_range(self):
+        """
+        Method that checks occurrences and departing find the same trips as
+        looking through every trip, for random ranges of days.
+        """
+        for run in range(300):
+            rule = random_rule()
+            intervals = expand(rule)
+            self.assertEqual(days(rule.occurrences()), intervals)
+            for check in range(20):
+                first = START + random.randrange(-10, 300)
+                last = first + random.randrange(0, 40)
+                self.assertEqual(days(rule.occurrences(first, last)),
+                                 [(d, a) for d, a in intervals if a >= first and d <= last])
+                self.assertEqual(days(rule.departing(first, last)),
+                                 [(d, a) for d, a in intervals if first <= d <= last])
+
+    def test_conflict(self):
+        """
+        Method that checks conflict gives the same reason as checking the
+        trip against every trip of the recurring trip.
+        """
+        for run in range(300):
+            rule = random_rule()
+            intervals = expand(rule)
+            for check in range(20):
+                departure = START + random.randrange(-10, 300)
+                arrival = departure + random.randint(1, 10)
+                self.assertEqual(rule.conflict(departure, arrival),
+                                 first_conflict(intervals, departure, arrival))
+
+    def test_conflict_recurring(self):
+        """
+        Method that checks conflict_recurring finds a conflict exactly when
+        some trip of one recurring trip conflicts with a trip of the other,
+        checking both ways round.
+        """
+        for run in range(1000):
+            rule = random_rule()
+            other = random_rule()
+            expected = any(first_conflict(expand(other), departure, arrival) is not None
+                           for departure, arrival in expand(rule))
+            self.assertEqual(rule.conflict_recurring(other) is not None, expected)
+            self.assertEqual(other.conflict_recurring(rule) is not None, expected)
+
+    def test_single_trip(self):
+        """
+        Method that checks a recurring trip that happens once may have an
+        interval no longer than its duration, and stands for one trip.
+        """
+        rule = RecurringTrip("Office", Date(3, 1, 2024), 5, 2, 1)
+        self.assertEqual(days(rule.occurrences()), [(Date(3, 1, 2024).daycount(), Date(3, 6, 2024).daycount())])
+        self.assertEqual(rule.conflict(Date(3, 6, 2024).daycount(), Date(3, 8, 2024).daycount()),
+                         "Departure date is the same as arrival date of other trips.")
+        self.assertIsNone(rule.conflict(Date(3, 7, 2024).daycount(), Date(3, 8, 2024).daycount()))
+
+    def test_invalid_rules(self):
+        """
+        Method that checks the recurring trips that are not allowed raise an
+        exception with the reason.
+        """
+        for duration, interval, count, reason in [(3, 3, 2, "Recurring trips overlap."),
+                                                  (3, 2, 5, "Recurring trips overlap."),
+                                                  (1, 0, 1, "Invalid Interval"),
+                                                  (1, 7, 0, "Invalid Count")]:
+            with self.assertRaises(Exception) as context:
+                RecurringTrip("Office", Date(3, 1, 2024), duration, interval, count)
+            self.assertEqual(str(context.exception), reason)
+
+    def test_search(self):
+        """
+        Method that checks searching a schedule by destination and by month
+        prints the matching trips and trips of recurring trips in order of
+        departure.
+        """
+        schedule = TripSchedule()
+        schedule.extend([Trip("Office" if k % 3 else "Plant", Date(2, 3, 2024) + 30 * k, 2)
+                         for k in range(30)])
+        schedule.insert_recurring(RecurringTrip("Office", Date(1, 1, 2024), 1, 15, 100))
+        trips = list(schedule) + list(schedule.recurring()[0].occurrences())
+        trips.sort(key=lambda trip: trip.departure().daycount())
+
+        for keyword, matches in [(" office ", lambda trip: trip.destination() == "Office"),
+                                 (3, lambda trip: trip.departure().month() == 3)]:
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                schedule.search(keyword)
+            expected = "".join(str(trip) + "\n" for trip in trips if matches(trip))
+            self.assertEqual(output.getvalue(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
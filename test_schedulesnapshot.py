@@ -0,0 +1,96 @@
+"""
+Author: Davis Nguyen
+
+Tests for ScheduleSnapshot, which check that snapshots keep the trips the
+schedule had when they were taken, and that diff finds the trips added and
+removed between them, with the trips kept in either kind of store.
+"""
+
+# Import the unittest module.
+import unittest
+
+# Import the Date, Trip, TripSchedule, and CompactTripStore classes.
+from date import Date
+from trip import Trip
+from tripschedule import TripSchedule
+from tripstore import CompactTripStore
+
+def stores():
+    """
+    Function that returns an empty store of each kind.
+    """
+    return [None, CompactTripStore()]
+
+def keys(trips):
+    """
+    Function that returns a sorted list of (departure, duration, destination)
+    for some trips, so trips can be compared however they are kept.
+    """
+    return sorted((trip.departure().daycount(), trip.duration(), trip.destination())
+                  for trip in trips)
+
+
+class ScheduleSnapshotTest(unittest.TestCase):
+    """
+    Class called "ScheduleSnapshotTest" that tests snapshots of a schedule.
+    """
+
+    def test_snapshot_is_frozen(self):
+        """
+        Method that checks a snapshot keeps its trips after the schedule
+        changes, and that diff finds the changes between two snapshots.
+        """
+        for storage in stores():
+            schedule = TripSchedule(storage)
+            schedule.extend([Trip("City", Date(1, 1, 2024) + 10 * k, 2) for k in range(20)])
+            before = schedule.snapshot()
+            old = list(schedule)
+            schedule.delete(schedule[3])
+            schedule.insert(Trip("New", Date(1, 1, 2023), 3))
+            after = schedule.snapshot()
+
+            self.assertEqual(keys(before), keys(old))
+            self.assertEqual(keys(after), keys(schedule))
+            added, removed = before.diff(after)
+            self.assertEqual(keys(added), keys([Trip("New", Date(1, 1, 2023), 3)]))
+            self.assertEqual(keys(removed), keys([old[3]]))
+            added, removed = after.diff(before)
+            self.assertEqual(keys(removed), keys([Trip("New", Date(1, 1, 2023), 3)]))
+            self.assertEqual(keys(added), keys([old[3]]))
+
+    def test_diff_after_sorting(self):
+        """
+        Method that checks sorting the schedule between two snapshots does
+        not show up as a change, and that a trip added and deleted in between
+        does not either.
+        """
+        for storage in stores():
+            schedule = TripSchedule(storage)
+            schedule.insert(Trip("B", Date(3, 10, 2024), 2))
+            first = schedule.snapshot()
+            trip = Trip("A", Date(3, 1, 2024), 2)
+            schedule.insert(trip)
+            schedule.sortbydeparture()
+            schedule.delete(schedule[0])
+            second = schedule.snapshot()
+
+            self.assertEqual(first.diff(second), ([], []))
+            self.assertEqual(keys(second), keys(schedule))
+
+    def test_sorting_keeps_snapshot_order(self):
+        """
+        Method that checks a snapshot taken after sorting lists the trips in
+        the same order as the schedule.
+        """
+        for storage in stores():
+            schedule = TripSchedule(storage)
+            schedule.extend([Trip("City {}".format(k), Date(1, 1, 2024) + 10 * ((7 * k) % 20), 2)
+                             for k in range(20)])
+            schedule.snapshot()
+            schedule.sortbydeparture()
+            self.assertEqual([str(trip) for trip in schedule.snapshot()],
+                             [str(trip) for trip in schedule])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+Author: Davis Nguyen
+
+Tests for TripSchedule, which check the methods that use its interval
+index against checking every trip one by one.
+"""
+
+# Import the random and unittest modules.
+import random
+import unittest
+
+# Import the Date, Trip, TripSchedule, CompactTripStore, Changeset, and
+# RecurringTrip classes.
+from date import Date
+from trip import Trip
+from tripschedule import TripSchedule
+from tripstore import CompactTripStore
+from changeset import Changeset
+from recurrence import RecurringTrip
+
+START = Date(1, 1, 2024)
+
+def contents(schedule):
+    """
+    Function that returns a sorted list of (departure, duration, destination)
+    for the trips of a schedule, so schedules can be compared however their
+    trips are kept.
+    """
+    return sorted((trip.departure().daycount(), trip.duration(), trip.destination())
+                  for trip in schedule)
+
+
+class TripScheduleTest(unittest.TestCase):
+    """
+    Class called "TripScheduleTest" that tests TripSchedule.
+    """
+
+    def test_index_follows_changed_trips(self):
+        """
+        Method that checks a trip in the schedule changed with its set
+        methods after the interval index was built is seen by the methods
+        that use the index.
+        """
+        schedule = TripSchedule()
+        trip = Trip("City", Date(3, 1, 2024), 2)
+        schedule.insert(trip)
+        schedule.feasible([])
+        trip.setDuration(10)
+
+        self.assertEqual(len(schedule.available(3, 2024)), 20)
+        self.assertEqual(schedule.feasible([Trip("Other", Date(3, 8, 2024), 1)]),
+                         [(False, "Trips overlap.")])
+        self.assertEqual(schedule.between(Date(3, 9, 2024), Date(3, 9, 2024)), [trip])
+        with self.assertRaises(Exception):
+            schedule.extend([Trip("b", Date(3, 5, 2024), 1)])
+        self.assertEqual(len(schedule), 1)
+
+        trip.setDeparture(Date(4, 1, 2024))
+        self.assertEqual(len(schedule.available(3, 2024)), 31)
+        self.assertEqual(schedule.between(Date(4, 11, 2024), Date(4, 20, 2024)), [trip])
+
+    def test_diff_and_apply(self):
+        """
+        Method that checks applying the diff of two random schedules makes
+        them the same, with the trips kept in either kind of store.
+        """
+        random.seed(5)
+        for storage in [None, CompactTripStore]:
+            for run in range(50):
+                slots = random.sample(range(60), 40)
+                local = TripSchedule(storage and storage())
+                local.extend([Trip("City {}".format(slot % 3), START + 10 * slot, 2)
+                              for slot in slots[:30]])
+                other = TripSchedule(storage and storage())
+                other.extend([Trip("City {}".format(slot % 3 if slot % 4 else 9), START + 10 * slot,
+                                   2 if slot % 5 else 4) for slot in slots[10:]])
+
+                changeset = local.diff(other)
+                removed = local.apply(changeset)
+                self.assertEqual(len(removed), len(changeset.removed()) + len(changeset.changed()))
+                self.assertEqual(contents(local), contents(other))
+                self.assertEqual(len(local.diff(other)), 0)
+
+    def test_apply_removal_not_in_schedule(self):
+        """
+        Method that checks a trip to remove departing on the day of a trip
+        in the schedule, but to another destination, is not removed, and that
+        nothing in the changeset is applied.
+        """
+        for storage in [None, CompactTripStore()]:
+            schedule = TripSchedule(storage)
+            schedule.extend([Trip("Paris", START, 2), Trip("Rome", START + 10, 2)])
+            before = contents(schedule)
+            changeset = Changeset(added=[Trip("Oslo", START + 20, 1)],
+                                  removed=[Trip("Rome", START, 2)])
+            with self.assertRaises(Exception) as context:
+                schedule.apply(changeset)
+            self.assertEqual(str(context.exception), "Trip to remove is not in the schedule.")
+            self.assertEqual(contents(schedule), before)
+
+            # The same trip with its destination written another way is removed.
+            schedule.apply(Changeset(removed=[Trip(" paris", START, 2)]))
+            self.assertEqual(contents(schedule), before[1:])
+
+    def test_apply_conflicting_additions(self):
+        """
+        Method that checks added trips that conflict with each other or with
+        a trip that stays raise an exception and leave the schedule unchanged,
+        while an added trip may take the place of a trip removed.
+        """
+        for storage in [None, CompactTripStore()]:
+            schedule = TripSchedule(storage)
+            schedule.extend([Trip("Paris", START, 2), Trip("Rome", START + 10, 2)])
+            before = contents(schedule)
+            for changeset, reason in [
+                    (Changeset(added=[Trip("A", START + 20, 3), Trip("B", START + 22, 1)],
+                               removed=[Trip("Paris", START, 2)]), "Trips overlap."),
+                    (Changeset(added=[Trip("A", START + 5, 5)]),
+                     "Departure date is the same as arrival date of other trips."),
+                    (Changeset(changed=[(Trip("Paris", START, 2), Trip("Paris", START, 10))]),
+                     "Departure date is the same as arrival date of other trips.")]:
+                with self.assertRaises(Exception) as context:
+                    schedule.apply(changeset)
+                self.assertEqual(str(context.exception), reason)
+                self.assertEqual(contents(schedule), before)
+
+            schedule.apply(Changeset(added=[Trip("A", START + 9, 4)], removed=[Trip("Rome", START + 10, 2)]))
+            self.assertEqual(contents(schedule), before[:1] + [((START + 9).daycount(), 4, "A")])
+
+    def test_apply_conflicts_with_recurring(self):
+        """
+        Method that checks an added trip that conflicts with a recurring trip
+        raises an exception and leaves the schedule unchanged.
+        """
+        schedule = TripSchedule()
+        schedule.insert(Trip("Paris", START, 2))
+        schedule.insert_recurring(RecurringTrip("Office", START + 7, 1, 7, 10))
+        before = contents(schedule)
+        with self.assertRaises(Exception) as context:
+            schedule.apply(Changeset(added=[Trip("Rome", START + 21, 1)],
+                                     removed=[Trip("Paris", START, 2)]))
+        self.assertEqual(str(context.exception), "Trips overlap.")
+        self.assertEqual(contents(schedule), before)
+
+        schedule.apply(Changeset(added=[Trip("Rome", START + 16, 3)]))
+        self.assertEqual(len(schedule), 2)
+
+    def test_calendar_and_available(self):
+        """
+        Method that checks calendar, calendars, available, and between against
+        marking every day of every trip and trip of a recurring trip, for
+        random schedules kept in either kind of store, over a leap year and
+        the years on either side of it.
+        """
+        random.seed(11)
+        for storage in [None, CompactTripStore, None, CompactTripStore]:
+            # Make trips a few days apart, leaving out those that conflict
+            # with a trip every 4 weeks.
+            schedule = TripSchedule(storage and storage())
+            rule = RecurringTrip("Office", Date(1, 1, 2022) + random.randrange(28), 2, 28, 60)
+            schedule.insert_recurring(rule)
+            day = Date(12, 1, 2022) + random.randrange(5)
+            trips = []
+            while day < Date(2, 1, 2026):
+                trip = Trip("City {}".format(len(trips) % 7), day, random.randint(1, 9))
+                if rule.conflict(trip.departure().daycount(), trip.arrival().daycount()) is None:
+                    trips.append(trip)
+                day = trip.arrival() + random.randint(1, 12)
+            schedule.extend(trips)
+
+            # Mark each day of travel with the trip travelling, as a tuple of
+            # its departure day count and destination.
+            travelling = {}
+            for trip in list(schedule) + list(rule.occurrences()):
+                for daycount in range(trip.departure().daycount(), trip.arrival().daycount() + 1):
+                    travelling[daycount] = (trip.departure().daycount(), trip.destination())
+            key = lambda trip: (trip.departure().daycount(), trip.destination()) if trip else None
+
+            for year in (2023, 2024, 2025):
+                calendar = schedule.calendar(year)
+                first = Date(1, 1, year).daycount()
+                dates = [Date.fromdaycount(daycount)
+                         for daycount in range(first, Date(1, 1, year + 1).daycount())]
+                self.assertEqual(len(calendar), len(dates))
+                for date in dates:
+                    self.assertEqual(key(calendar.trip(date.month(), date.day())),
+                                     travelling.get(date.daycount()))
+                    self.assertEqual(calendar.weekday(date.month(), date.day()), date.day_of_week())
+                free = [date for date in dates if date.daycount() not in travelling]
+                self.assertEqual(calendar.free_dates(), free)
+                for month in range(1, 13):
+                    expected = [date for date in free if date.month() == month]
+                    self.assertEqual(calendar.free_dates(month), expected)
+                    self.assertEqual(schedule.available(month, year), expected)
+                self.assertEqual([str(other) for other in TripSchedule.calendars([schedule, schedule], year)],
+                                 [str(calendar)] * 2)
+
+            for check in range(50):
+                start = Date(11, 1, 2022) + random.randrange(1200)
+                end = start + random.randrange(30)
+                expected = sorted(set(travelling[daycount] for daycount in range(start.daycount(), end.daycount() + 1)
+                                      if daycount in travelling))
+                self.assertEqual([key(trip) for trip in schedule.between(start, end)], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
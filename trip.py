@@ -5,8 +5,27 @@ Trip class uses Date class to keep track of a travel
 schedule for one person.
 """
 
-# Import the Date class.
+# Import the Date class, and the catalogue of destinations.
 from date import Date
+from destination import catalogue
+
+def conflict(departure1, arrival1, departure2, arrival2):
+    """
+    Function that returns the reason two trips conflict, or None if they do
+    not. The trips are given as the day counts(see Date.daycount) of their
+    departures and arrivals. The checks are the same as those of
+    TripSchedule.insert.
+    """
+
+    # If one trip departs on the day the other arrives, this creates a conflict.
+    if departure1 == arrival2 or arrival1 == departure2:
+        return "Departure date is the same as arrival date of other trips."
+
+    # If the dates of travel of the trips overlap, this creates a conflict.
+    if departure1 <= arrival2 and departure2 <= arrival1:
+        return "Trips overlap."
+
+    return None
 
 class Trip:
     """
@@ -14,6 +33,11 @@ class Trip:
     an employee whose job requires frequent travel.
     """
 
+    # The number of times any trip has been changed with its set methods.
+    # A TripSchedule keeps an interval index of its trips, and checks this
+    # to know when a trip in it may have changed since the index was built.
+    changes = 0
+
     def __init__(self, destination, depdate, duration):
         """
         Constructor that initializes the three trip instance
@@ -24,8 +48,11 @@ class Trip:
         duration: the duration of the trip(integer >= 1).
         """
 
-        # Instance attributes for destination, depdate, and duration.
-        self.__dest = destination
+        # Instance attributes for destination, depdate, and duration. The
+        # destination is added to the catalogue of destinations, and the trip
+        # keeps the catalogue's string for it, which is shared by every trip
+        # with the destination written the same way, along with its id.
+        self.__dest, self.__dest_id = catalogue.entry(destination)
         self.__dep = depdate
         self.__dur = duration
 
@@ -35,7 +62,8 @@ class Trip:
 
         destination: a string value representing a destination of a trip.
         """
-        self.__dest = destination
+        self.__dest, self.__dest_id = catalogue.entry(destination)
+        Trip.changes += 1
 
     def setDeparture(self, depdate):
         """
@@ -44,6 +72,7 @@ class Trip:
         depdate: a Date object value representing a trip departure date.
         """
         self.__dep = depdate
+        Trip.changes += 1
 
     def setDuration(self, duration):
         """
@@ -52,6 +81,7 @@ class Trip:
         duration: an integer value representing the duration of a trip.
         """
         self.__dur = duration
+        Trip.changes += 1
 
     def destination(self):
         """
@@ -59,6 +89,14 @@ class Trip:
         """
         return self.__dest
 
+    def destination_id(self):
+        """
+        Method that returns the id of the trip's destination in the catalogue
+        of destinations. Trips to the same city have the same id, however the
+        upper or lower case letters and spaces of their destinations differ.
+        """
+        return self.__dest_id
+
     def departure(self):
         """
         Method that returns the departure date of the trip.
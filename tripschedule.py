@@ -8,12 +8,26 @@ Note: No two trips can overlap with each other. This means
 the dates where a person is traveling on one trip cannot overlap
 with the dates they are traveling on another.
 Also, a person cannot depart on a trip on the same day they return
-from another trip.
+from another trip. The same rules apply to recurring trips, which are
+kept as rules rather than as a trip for every time they happen.
 """
 
-# Import the Trip and Date classes.
-from trip import Trip
+# Import the chain function for going through several lists of trips, the
+# merge function for going through several sorted lists of trips in order,
+# and the bisect function for finding trips in the interval index.
+from itertools import chain
+from heapq import merge
+from bisect import bisect_left
+
+# Import the Trip and Date classes and the conflict function. The
+# ScheduleHistory class used for snapshots is imported by the snapshot
+# method, so programs that never take snapshots do not pay for importing it.
+from trip import Trip, conflict
 from date import Date
+from tripstore import TripList
+from destination import catalogue
+from changeset import Changeset
+from yearcalendar import YearCalendar, empty_days, year_layout
 
 class TripSchedule:
     """
@@ -21,14 +35,35 @@ class TripSchedule:
     the trip schedule for one person.
     """
 
-    def __init__(self):
+    def __init__(self, storage=None):
         """
         Constructor that creates an empty trip schedule for trips to be
         added to.
+
+        storage: an empty store to keep the trips in, such as a
+        CompactTripStore for very large schedules. By default the trips
+        are kept in a TripList.
         """
 
-        # The schedule will be represented as a list.
-        self.__schedule = []
+        # The schedule will be represented as a list, unless another store
+        # is given.
+        self.__schedule = TripList() if storage is None else storage
+
+        # The history used to take snapshots of the schedule. It is only
+        # created the first time a snapshot is taken.
+        self.__history = None
+
+        # The recurring trips in the schedule, kept as RecurringTrip objects.
+        self.__rules = []
+
+        # The interval index of the schedule: a list of tuples (departure,
+        # arrival, place) of the day counts of the trips and their places in
+        # the schedule, sorted by departure. It is built when first needed and
+        # thrown away whenever the trips are added, removed, or sorted. It is
+        # also built again if any trip has been changed with its set methods
+        # since(see Trip.changes), since the trip may be in this schedule.
+        self.__index = None
+        self.__index_changes = 0
 
     def insert(self, new_trip):
         """
@@ -52,8 +87,61 @@ class TripSchedule:
             if new_trip.overlaps(trip):
                 raise Exception("Trips overlap.")
 
+        # If the new trip conflicts with any of the recurring trips, raise an
+        # exception with the reason.
+        departure = new_trip.departure().daycount()
+        self.__check_recurring(departure, departure + new_trip.duration())
+
         # If there are no conflicts, add the new trip to the schedule.
         self.__schedule.append(new_trip)
+        self.__index = None
+
+        # If snapshots are being taken, record the new trip in the history.
+        if self.__history is not None:
+            self.__history.inserted(new_trip)
+
+    def extend(self, new_trips):
+        """
+        Method that adds many new trips to the schedule at once. The trips are
+        checked against the schedule and against each other by sorting them
+        by departure date, which is much faster than inserting them one at a
+        time. If any trip conflicts, an exception is raised and none of the
+        trips are added.
+
+        new_trips: a list of Trip objects to be added to the trip schedule.
+        """
+
+        # Create a list of the departure and arrival day counts of every trip,
+        # old and new, sorted by departure.
+        new_trips = TripList(new_trips)
+        new_intervals = new_trips.intervals()
+        intervals = self.__interval_index() + new_intervals
+        intervals.sort()
+
+        # Since the trips are sorted, a trip can only conflict with another
+        # one if it conflicts with the trip just before it.
+        for i in range(1, len(intervals)):
+
+            # If the trip departs on the day the trip before it arrives, this
+            # creates a conflict, so raise an exception.
+            if intervals[i][0] == intervals[i-1][1]:
+                raise Exception("Departure date is the same as arrival date of other trips.")
+
+            # If the trip departs before the trip before it arrives, the trips
+            # overlap, so raise an exception.
+            if intervals[i][0] < intervals[i-1][1]:
+                raise Exception("Trips overlap.")
+
+        # Check the new trips against the recurring trips too.
+        for departure, arrival in new_intervals:
+            self.__check_recurring(departure, arrival)
+
+        # If there are no conflicts, add the new trips to the schedule.
+        self.__index = None
+        for new_trip in new_trips:
+            self.__schedule.append(new_trip)
+            if self.__history is not None:
+                self.__history.inserted(new_trip)
 
     def delete(self, trip):
         """
@@ -61,7 +149,231 @@ class TripSchedule:
 
         trip: a Trip object in the schedule to be removed.
         """
-        self.__schedule.remove(trip)
+
+        # Find where the trip is in the schedule and remove it from there.
+        j = self.__schedule.index(trip)
+        del self.__schedule[j]
+        self.__index = None
+
+        # If snapshots are being taken, record the removal in the history.
+        if self.__history is not None:
+            self.__history.deleted(j)
+
+    def feasible(self, candidates):
+        """
+        Method that checks many candidate trips against the schedule at once,
+        without adding them. Each candidate is checked on its own, as if it
+        were the only trip being inserted. The candidates are sorted and then
+        swept through the interval index of the schedule in a single pass.
+
+        Returns a list with a tuple (accepted, reason) for each candidate, in
+        the order given. accepted is True if the candidate could be inserted,
+        and reason is None if so, or else the message insert would raise.
+
+        candidates: a list of Trip objects.
+        """
+
+        # Create a list of the departure and arrival day counts of the
+        # candidates, along with their places in the list, sorted by departure.
+        sorted_candidates = sorted((departure, arrival, i) for i, (departure, arrival)
+                                   in enumerate(TripList(candidates).intervals()))
+
+        index = self.__interval_index()
+        results = [None] * len(sorted_candidates)
+        p = 0
+        for departure, arrival, i in sorted_candidates:
+
+            # Move past the trips that arrive before the candidate departs.
+            # Since trips in the schedule never overlap, the trips are in order
+            # of arrival too, so the only trip that can conflict with the
+            # candidate is the first one left, if it departs by the candidate's
+            # arrival.
+            while p < len(index) and index[p][1] < departure:
+                p += 1
+            reason = None
+            if p < len(index):
+                reason = conflict(index[p][0], index[p][1], departure, arrival)
+
+            # Check the candidate against the recurring trips too.
+            for rule in self.__rules:
+                if reason is None:
+                    reason = rule.conflict(departure, arrival)
+
+            results[i] = (reason is None, reason)
+
+        return results
+
+    def diff(self, other):
+        """
+        Method that returns a Changeset of the trips that would have to be
+        added, removed, and changed to turn this schedule into the schedule
+        other. Trips are matched by departure date, and a matched trip has
+        changed if its duration or destination(see Trip.destination_id)
+        differs. Both schedules are walked in order of departure together,
+        in a single pass. Recurring trips are not compared.
+
+        other: a second TripSchedule.
+        """
+
+        # Create lists of (departure, arrival, place) for the trips in each
+        # schedule, sorted by departure, and the destination ids of the trips.
+        mine = sorted((departure, arrival, j) for j, (departure, arrival)
+                      in enumerate(self.__schedule.intervals()))
+        theirs = sorted((departure, arrival, j) for j, (departure, arrival)
+                        in enumerate(other.__schedule.intervals()))
+        my_ids = self.__schedule.destination_ids()
+        their_ids = other.__schedule.destination_ids()
+
+        added = []
+        removed = []
+        changed = []
+        i = k = 0
+        while i < len(mine) or k < len(theirs):
+
+            # If the next trip in this schedule departs before the next trip in
+            # the other, it is not in the other schedule, so it is removed.
+            if k == len(theirs) or (i < len(mine) and mine[i][0] < theirs[k][0]):
+                removed.append(self.__schedule[mine[i][2]])
+                i += 1
+
+            # If the next trip in the other schedule departs first, it is added.
+            elif i == len(mine) or theirs[k][0] < mine[i][0]:
+                added.append(other.__schedule[theirs[k][2]])
+                k += 1
+
+            # If both depart on the same day, the trip has changed if its
+            # arrival or destination differs.
+            else:
+                if mine[i][1] != theirs[k][1] or my_ids[mine[i][2]] != their_ids[theirs[k][2]]:
+                    changed.append((self.__schedule[mine[i][2]], other.__schedule[theirs[k][2]]))
+                i += 1
+                k += 1
+
+        return Changeset(added, removed, changed)
+
+    def apply(self, changeset):
+        """
+        Method that makes the changes in a changeset to the schedule. Only the
+        trips next to each added trip are checked for conflicts, rather than
+        the whole schedule. If a trip to remove is not in the schedule or an
+        added trip conflicts, an exception is raised and nothing is changed.
+
+        Returns a list of the trips removed, as they were kept in the schedule.
+
+        changeset: a Changeset, such as one returned by diff.
+        """
+
+        # A changed trip is removed and its new version is added.
+        removing = changeset.removed() + [old for old, new in changeset.changed()]
+        adding = changeset.added() + [new for old, new in changeset.changed()]
+
+        # Find the place in the schedule of each trip to remove by its
+        # departure day count, since only one trip departs on each day, and
+        # check that the trip there has the same arrival and destination.
+        places = {}
+        for j, (departure, arrival) in enumerate(self.__schedule.intervals()):
+            places[departure] = (j, arrival)
+        ids = self.__schedule.destination_ids()
+        removed_places = {}
+        for trip, (departure, arrival) in zip(removing, TripList(removing).intervals()):
+            if departure not in places or places[departure][1] != arrival or \
+                    ids[places[departure][0]] != trip.destination_id():
+                raise Exception("Trip to remove is not in the schedule.")
+            j = places[departure][0]
+            removed_places[j] = self.__schedule[j]
+
+        # Create the interval index of the trips that stay in the schedule.
+        removed_departures = set(departure for departure, arrival in TripList(removing).intervals())
+        remaining = [interval for interval in self.__interval_index()
+                     if interval[0] not in removed_departures]
+
+        # Check each added trip against the trips next to it: the last trip
+        # that stays departing before it, the first one departing on or after
+        # it, and the added trip before it in order of departure.
+        new_intervals = sorted(TripList(adding).intervals())
+        for i, (departure, arrival) in enumerate(new_intervals):
+            p = bisect_left(remaining, (departure,))
+            neighbours = remaining[max(p - 1, 0):p + 1] + new_intervals[max(i - 1, 0):i]
+            for neighbour in neighbours:
+                reason = conflict(neighbour[0], neighbour[1], departure, arrival)
+                if reason is not None:
+                    raise Exception(reason)
+            self.__check_recurring(departure, arrival)
+
+        # If there are no conflicts, remove the trips, starting from the end
+        # so the places of the others do not move, and then add the new ones.
+        removed = []
+        for j in sorted(removed_places, reverse=True):
+            removed.append(removed_places[j])
+            del self.__schedule[j]
+            if self.__history is not None:
+                self.__history.deleted(j)
+        for new_trip in adding:
+            self.__schedule.append(new_trip)
+            if self.__history is not None:
+                self.__history.inserted(new_trip)
+        self.__index = None
+
+        return removed
+
+    def insert_recurring(self, rule):
+        """
+        Method that adds a recurring trip to the schedule if none of its trips
+        conflict with the trips already in the schedule.
+
+        rule: a RecurringTrip object to be added to the trip schedule.
+        """
+
+        # If the recurring trip conflicts with any trip in the schedule, raise
+        # an exception with the reason.
+        for departure, arrival, place in self.__interval_index():
+            reason = rule.conflict(departure, arrival)
+            if reason is not None:
+                raise Exception(reason)
+
+        # If the recurring trip conflicts with any other recurring trip, raise
+        # an exception with the reason.
+        for other in self.__rules:
+            reason = rule.conflict_recurring(other)
+            if reason is not None:
+                raise Exception(reason)
+
+        # If there are no conflicts, add the recurring trip to the schedule.
+        self.__rules.append(rule)
+
+    def delete_recurring(self, rule):
+        """
+        Method that deletes a recurring trip from the schedule.
+
+        rule: a RecurringTrip object in the schedule to be removed.
+        """
+        self.__rules.remove(rule)
+
+    def recurring(self):
+        """
+        Method that returns a list of the recurring trips in the schedule.
+        """
+        return list(self.__rules)
+
+    def snapshot(self):
+        """
+        Method that returns a ScheduleSnapshot, a read-only view of the
+        schedule as it is now. Later changes to the schedule do not show up
+        in the snapshot. Recurring trips are not part of snapshots.
+
+        Taking a snapshot takes O(1) time, except for the first one, which
+        takes O(N) time to start following the schedule. Snapshots hold Trip
+        objects, so for a schedule kept in a CompactTripStore the first one
+        also makes a Trip object for every trip.
+        """
+
+        # Start following the changes to the schedule the first time a
+        # snapshot is taken.
+        if self.__history is None:
+            from schedulesnapshot import ScheduleHistory
+            self.__history = ScheduleHistory(self.__schedule)
+
+        return self.__history.snapshot()
 
     def __len__(self):
         """
@@ -97,43 +409,44 @@ class TripSchedule:
         integer from 1 to 12(inclusive), all trips in the schedule that start
         in that month are printed out. Otherwise, the keyword is assumed to be
         a destination string value and all trips in the schedule with that
-        destination are printed out. The trips are printed out sorted in order
-        by departure date.
+        destination are printed out, without regard to upper or lower case or
+        extra spaces. The trips are printed out sorted in order by departure
+        date. Matching trips of recurring trips are printed too.
 
         keyword: a value that can either be an integer or a string.
         """
 
-        # Create a list for the final sorted schedule that will add the sorted trips.
-        sorted_schedule = []
+        # The trips of the recurring trips that match are found as iterators,
+        # each in order of departure, so they are only made as they are printed.
+        recurring_trips = []
 
         # If the keyword is an integer, create a list key_trips that has all
         # trips whose month matches with keyword.
         if type(keyword) is int:
-            key_trips = list(filter(lambda x: x.departure().month() == keyword, self.__schedule))
-
-        # If the keyword is a string, create a list key_trips that
-        # has all trips whose destination matches with keyword.
+            matches = lambda x: x.departure().month() == keyword
+            key_trips = list(filter(matches, self.__schedule))
+            if 1 <= keyword <= 12:
+                for rule in self.__rules:
+                    recurring_trips.append(self.__departing_in_month(rule, keyword))
+
+        # If the keyword is a string, create a list key_trips that has all
+        # trips whose destination id matches the id of keyword. Only the
+        # trips that match are looked up in the schedule.
         else:
-            key_trips = list(filter(lambda x: x.destination() == keyword, self.__schedule))
-
-        # Create a list of the sorted departure dates for each trip in key_trips.
-        departure_list = sorted([trip.departure() for trip in key_trips])
-
-        
-        # For loop that iterates through each departure date in the departure_list.
-        # These dates will help sort the trips themselves into the final
-        # sorted schedule.
-        for date in departure_list:
-
-            # For each trip in the key_trips list, if the trip's departure date
-            # is equal to the departure date in the departure_list, then add the
-            # trip to the sorted schedule in its correct order.
-            for trip in key_trips:
-                if trip.departure() == date:
-                    sorted_schedule.append(trip)
-        
-        # Print each trip in the final sorted schedule.
-        for trip in sorted_schedule:
+            target = catalogue.lookup(keyword)
+            ids = self.__schedule.destination_ids()
+            key_trips = [self.__schedule[j] for j in range(len(ids)) if ids[j] == target]
+            for rule in self.__rules:
+                if rule.destination_id() == target:
+                    recurring_trips.append(rule.occurrences())
+
+        # Sort the trips in key_trips by the day counts of their departure
+        # dates, and merge them with the trips of the recurring trips.
+        by_departure = lambda trip: trip.departure().daycount()
+        key_trips.sort(key=by_departure)
+
+        # Print each trip in sorted order.
+        for trip in merge(key_trips, *recurring_trips, key=by_departure):
             print(trip)
 
     def available(self, month, year):
@@ -145,43 +458,50 @@ class TripSchedule:
         year: an integer representing a year.
         """
 
-        # List of the number of days in each month.
-        monthdays = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-
-        # If the year of the date is a leap year, change the number of days
-        # in February to 29 in the month days list.
-        if Date(month, 1, year).year_is_leap():
-            monthdays[1] = 29
-
-        # Create a list of all the available dates to be added to.
-        available_dates = []
+        # Find the day counts of the first and last days of the month. Making
+        # the first day checks that the month and year are valid.
+        first_day = Date(month, 1, year)
+        first = first_day.daycount()
+        last = first + Date.days_in_month[month - 1] - 1
+        if month == 2 and first_day.year_is_leap():
+            last += 1
 
-        # Create a list of all the dates for each trip, day to day.
-        date_list = []
+        # Mark the days of the month on which there is travel, and return the
+        # days that are left as Date objects.
+        days = self.__occupancy(first, last)[1]
+        return [Date.fromdaycount(first + i) for i in range(len(days)) if days[i] == 0]
 
-        # Iterate through each trip in the schedule and add each date in the
-        # trip to the date_list.
-        for trip in self.__schedule:
-            date = trip.departure()
-            for i in range(trip.duration()+1):
-                date_list.append(date)
-                date += 1 # Add 1 to the date to get the next day in the trip.
-
-        # Iterate through each day in the given month.
-        for day in range(1,monthdays[month-1]+1):
+    def calendar(self, year, layout=None):
+        """
+        Method that returns a YearCalendar of the schedule for a year, which
+        tells for each day whether it is free, which trip is travelling, and
+        its day of week. Only the trips in the interval index that travel
+        during the year are looked at, along with the trips of recurring trips
+        that travel during it.
 
-            # For each day in the month, set a Date object of the current date
-            # in the iteration.
-            new_date = Date(month, day, year)
+        year: an integer representing a year.
+        layout: the layout of the year from yearcalendar.year_layout, if it
+        has already been worked out, or None to work it out.
+        """
+        if layout is None:
+            layout = year_layout(year)
+        first = layout[0]
+        trips, days = self.__occupancy(first, first + layout[1][12] - 1)
+        return YearCalendar(year, trips, days, layout)
 
-            # If the current date is not in the date_list, that means the current
-            # date is not a date of travel, so it is available and add it to
-            # the available dates list.
-            if new_date not in date_list:
-                available_dates.append(new_date)
+    @staticmethod
+    def calendars(schedules, year):
+        """
+        Method that returns a list of the YearCalendar for a year of each
+        schedule in a list, such as the schedules of many travellers. The
+        layout of the year is worked out once and shared by all the
+        calendars, so each one only costs looking up its own trips.
 
-        # When the loops end, return the final list of available dates in month of year.
-        return available_dates
+        schedules: a list of TripSchedule objects.
+        year: an integer representing a year.
+        """
+        layout = year_layout(year)
+        return [schedule.calendar(year, layout) for schedule in schedules]
 
     def weekend_travel(self, yr):
         """
@@ -194,8 +514,13 @@ class TripSchedule:
         # Create a list for the sorted trips in the schedule by departure date.
         sorted_schedule = []
 
+        # Create a list of the trips in the schedule, along with the trips of
+        # recurring trips that travel during the year yr.
+        year = max(yr, Date.min_year)
+        trips = self.__with_recurring(Date(1, 1, year).daycount(), Date(12, 31, year).daycount())
+
         # Create a list of sorted departure dates for all trips.
-        departure_list = sorted([trip.departure() for trip in self.__schedule])
+        departure_list = sorted([trip.departure() for trip in trips])
 
         # Create a list of all the departure dates in the year yr for all trips.
         year_dates = [dep for dep in departure_list if dep.year() == yr]
@@ -206,7 +531,7 @@ class TripSchedule:
             # For each trip in the schedule, if the trip's departure date
             # is equal to the departure date in the year_dates list, then
             # add the trip to the sorted schedule in its correct order.
-            for trip in self.__schedule:
+            for trip in trips:
                 if trip.departure() == date:
                     sorted_schedule.append(trip)
 
@@ -214,62 +539,188 @@ class TripSchedule:
         # new list of sorted trips that contain weekends.
         return [trip for trip in sorted_schedule if trip.containsweekend()]
 
+    def group_by_destination(self):
+        """
+        Method that returns a dictionary with the name of each destination in
+        the schedule(as kept by the catalogue of destinations) as a key, and a
+        list of the trips in the schedule to that destination as its value.
+        Recurring trips are not included.
+        """
+
+        # Group the places of the trips in the schedule by destination id.
+        groups = {}
+        for j, destination_id in enumerate(self.__schedule.destination_ids()):
+            groups.setdefault(destination_id, []).append(j)
+
+        return {catalogue.name(destination_id): [self.__schedule[j] for j in places]
+                for destination_id, places in groups.items()}
+
     def earliest(self):
         """
         Method that returns the trip in the schedule that has the earliest
-        departure date of all the trips.
+        departure date of all the trips, including recurring trips.
         """
 
+        # Create a list of the trips in the schedule along with the first trip
+        # of each recurring trip.
+        trips = list(self.__schedule) + [rule.occurrence(0) for rule in self.__rules]
+
         # Create a list of sorted departure dates for all trips.
-        departure_list = sorted([trip.departure() for trip in self.__schedule])
+        departure_list = sorted([trip.departure() for trip in trips])
 
-        # For each trip in the schedule, if the trip's departure date matches
-        # the first departure date in the departure_list, then that is the first
-        # trip in the schedule, so return it.
-        for trip in self.__schedule:
+        # For each trip, if the trip's departure date matches the first
+        # departure date in the departure_list, then that is the first trip
+        # in the schedule, so return it.
+        for trip in trips:
             if trip.departure() == departure_list[0]:
                 return trip
 
     def last(self):
         """
         Method that returns the trip in the schedule that has the latest
-        departure date of all the trips.
+        departure date of all the trips, including recurring trips.
         """
 
+        # Create a list of the trips in the schedule along with the last trip
+        # of each recurring trip.
+        trips = list(self.__schedule) + [rule.occurrence(rule.count() - 1) for rule in self.__rules]
+
         # Create a list of sorted departure dates for all trips.
-        departure_list = sorted([trip.departure() for trip in self.__schedule])
+        departure_list = sorted([trip.departure() for trip in trips])
 
-        # For each trip in the schedule, if the trip's departure date matches
-        # the final departure date in the departure_list, then that is the last
-        # trip in the schedule, so return it.
-        for trip in self.__schedule:
+        # For each trip, if the trip's departure date matches the final
+        # departure date in the departure_list, then that is the last trip
+        # in the schedule, so return it.
+        for trip in trips:
             if trip.departure() == departure_list[-1]:
                 return trip
 
+    def between(self, start, end):
+        """
+        Method that returns a list of all trips, including trips of recurring
+        trips, that travel on any date from start to end(inclusive). The list
+        stores the trips in sorted order by departure date.
+
+        start: a Date object of the first date of the range.
+        end: a Date object of the last date of the range.
+        """
+        first = start.daycount()
+        last = end.daycount()
+
+        # Find the trips in the schedule whose dates of travel reach into the range.
+        found = [self.__schedule[place] for departure, arrival, place in self.__travelling(first, last)]
+
+        # Add the trips of each recurring trip that travel during the range.
+        for rule in self.__rules:
+            found.extend(rule.occurrences(first, last))
+
+        # Sort the trips by the day counts of their departure dates.
+        found.sort(key=lambda trip: trip.departure().daycount())
+        return found
+
     def sortbydeparture(self):
         """
         Method that sorts all the trips in the schedule by their departure dates.
         """
 
-        # Create a list for the final sorted schedule.
-        sorted_schedule = []
+        # Sort the trips in the schedule by departure date. Both kinds of
+        # store sort by departure date when no key is given, which lets a
+        # CompactTripStore sort its arrays without making Trip objects.
+        self.__schedule.sort()
+        self.__index = None
 
-        # Create a list of sorted departure dates for all trips.
-        departure_list = sorted([trip.departure() for trip in self.__schedule])
+        # If snapshots are being taken, record the new order in the history.
+        if self.__history is not None:
+            self.__history.reordered()
+
+    def __interval_index(self):
+        """
+        Method that returns the interval index of the schedule, building it
+        if there have been changes since it was last built.
+        """
+        if self.__index is None or self.__index_changes != Trip.changes:
+            self.__index_changes = Trip.changes
+            self.__index = sorted((departure, arrival, place) for place, (departure, arrival)
+                                  in enumerate(self.__schedule.intervals()))
+        return self.__index
 
-        # For loop that iterates through each departure date in the departure_list.
-        for date in departure_list:
+    def __travelling(self, first, last):
+        """
+        Method that returns the part of the interval index for the trips that
+        travel on any day from the day count first to the day count last.
+        """
+        index = self.__interval_index()
 
-            # For each trip in the schedule, if the trip's departure date
-            # is equal to the departure date in the departure_list, then add the
-            # trip to the sorted schedule in its correct order.
-            for trip in self.__schedule:
-                if trip.departure() == date:
-                    sorted_schedule.append(trip)
+        # Find the first trip departing on or after first. Since trips never
+        # overlap, the only earlier trip that can still be travelling on first
+        # is the one just before it.
+        p = bisect_left(index, (first,))
+        if p > 0 and index[p - 1][1] >= first:
+            p -= 1
+        return index[p:bisect_left(index, (last + 1,))]
 
-        # Set the original schedule equal to the final sorted schedule, showing
-        # the sorted trips by departure date.
-        self.__schedule = sorted_schedule
+    def __occupancy(self, first, last):
+        """
+        Method that returns a list of the trips, including trips of recurring
+        trips, that travel on any day from the day count first to the day
+        count last, along with an array with a number for each of those
+        days: 0 if there is no travel, or else 1 more than the place of the
+        trip travelling in the list.
+        """
+        trips = []
+        intervals = []
+        for departure, arrival, place in self.__travelling(first, last):
+            trips.append(self.__schedule[place])
+            intervals.append((departure, arrival))
+        for rule in self.__rules:
+            for trip in rule.occurrences(first, last):
+                departure = trip.departure().daycount()
+                trips.append(trip)
+                intervals.append((departure, departure + trip.duration()))
+
+        # Mark each day a trip is travelling with 1 more than its place in
+        # the list of trips.
+        days = empty_days(last - first + 1)
+        for place, (departure, arrival) in enumerate(intervals):
+            for i in range(max(departure, first) - first, min(arrival, last) - first + 1):
+                days[i] = place + 1
+
+        return trips, days
+
+    def __check_recurring(self, departure, arrival):
+        """
+        Method that raises an exception if a trip conflicts with any of the
+        recurring trips in the schedule.
+
+        departure: the day count of the trip's departure date.
+        arrival: the day count of the trip's arrival date.
+        """
+        for rule in self.__rules:
+            reason = rule.conflict(departure, arrival)
+            if reason is not None:
+                raise Exception(reason)
+
+    def __departing_in_month(self, rule, month):
+        """
+        Method that returns an iterator over the trips of a recurring trip
+        that depart in month, in any year, in order of departure. Only the
+        years the recurring trip spans are looked at, and the trips in each
+        are found by arithmetic.
+        """
+        first_year = rule.departure().year()
+        last_year = rule.occurrence(rule.count() - 1).departure().year()
+        for year in range(first_year, last_year + 1):
+            first = Date(month, 1, year).daycount()
+            last = Date(month % 12 + 1, 1, year + month // 12).daycount() - 1
+            yield from rule.departing(first, last)
+
+    def __with_recurring(self, first, last):
+        """
+        Method that returns a list of the trips in the schedule along with the
+        trips of recurring trips that travel on any day from the day count
+        first to the day count last.
+        """
+        return list(chain(self.__schedule, *[rule.occurrences(first, last) for rule in self.__rules]))
 
     def __str__(self):
         """
@@ -301,6 +752,13 @@ class TripScheduleIterator:
         self.__sched = schedule
         self.__idx = 0
 
+    def __iter__(self):
+        """
+        Method that returns the iterator itself, so it can be used in for
+        loops and passed to functions such as list().
+        """
+        return self
+
     def __next__(self):
         """
         Method that returns the next trip in the trip schedule.
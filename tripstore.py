@@ -0,0 +1,206 @@
+"""
+Author: Davis Nguyen
+
+TripList and CompactTripStore classes are the two ways a TripSchedule
+can store its trips.
+
+Note: A TripList simply holds the Trip objects in a list. A
+CompactTripStore holds only numbers in arrays, which takes far less
+memory for very large schedules, and makes a new Trip object each time
+a trip is looked up. Changing a Trip object taken from a CompactTripStore
+does not change the trip in the store. Snapshots(see TripSchedule.snapshot)
+hold Trip objects, so taking a snapshot of a schedule kept in a
+CompactTripStore makes a Trip object for every trip, and gives up the
+memory saved until the snapshots are no longer used.
+"""
+
+# Import the array module for the compact store.
+from array import array
+
+# Import the Date and Trip classes, and the catalogue of destinations.
+from date import Date
+from trip import Trip
+from destination import catalogue
+
+class TripList(list):
+    """
+    Class called "TripList" that stores the trips of a schedule as a list of
+    Trip objects. This is the storage a TripSchedule uses by default.
+    """
+
+    def sort(self, key=None, reverse=False):
+        """
+        Method that sorts the trips in the list, by departure date if no key
+        is given.
+
+        key: a function that takes a Trip object and returns the value to sort by.
+        reverse: True to sort in reverse order.
+        """
+        if key is None:
+            key = lambda trip: trip.departure().daycount()
+        super().sort(key=key, reverse=reverse)
+
+    def intervals(self):
+        """
+        Method that returns a list of (departure, arrival) day counts, one for
+        each trip, in schedule order.
+        """
+        intervals = []
+        for trip in self:
+            departure = trip.departure().daycount()
+            intervals.append((departure, departure + trip.duration()))
+        return intervals
+
+    def destination_ids(self):
+        """
+        Method that returns a list of the destination ids(see Trip.destination_id)
+        of the trips, in schedule order.
+        """
+        return [trip.destination_id() for trip in self]
+
+
+class CompactTripStore:
+    """
+    Class called "CompactTripStore" that stores the trips of a schedule as
+    arrays of numbers rather than as Trip objects. It can be passed to a
+    TripSchedule to hold very large schedules.
+    """
+
+    def __init__(self, trips=()):
+        """
+        Constructor that creates a store holding the given trips.
+
+        trips: a list of Trip objects to store, empty by default.
+        """
+
+        # Arrays of the departure day counts(see Date.daycount), durations,
+        # and destination numbers of the trips, in schedule order.
+        self.__departures = array("i")
+        self.__durations = array("i")
+        self.__destinations = array("i")
+
+        # Each way of writing a destination is stored once, in a list, and
+        # trips refer to it by its place in the list. The dictionary finds a
+        # destination's place, and the last list holds the destination id of
+        # each place.
+        self.__names = []
+        self.__name_ids = {}
+        self.__name_destinations = []
+
+        for trip in trips:
+            self.append(trip)
+
+    def append(self, trip):
+        """
+        Method that adds a trip to the end of the store.
+
+        trip: a Trip object.
+        """
+        self.__departures.append(trip.departure().daycount())
+        self.__durations.append(trip.duration())
+        self.__destinations.append(self.__name_id(trip.destination()))
+
+    def extend(self, trips):
+        """
+        Method that adds trips to the end of the store.
+
+        trips: a list of Trip objects.
+        """
+        for trip in trips:
+            self.append(trip)
+
+    def index(self, trip):
+        """
+        Method that returns the index of the stored trip with the same
+        destination, departure date, and duration as trip. A ValueError is
+        raised if there is no such trip.
+
+        trip: a Trip object.
+        """
+
+        # Since trips in a schedule never overlap, at most one trip departs
+        # on any day, so search the departures first.
+        departure = trip.departure().daycount()
+        if departure in self.__departures:
+            j = self.__departures.index(departure)
+            if self.__durations[j] == trip.duration() and \
+                    self.__names[self.__destinations[j]] == trip.destination():
+                return j
+        raise ValueError("Trip is not in the store.")
+
+    def sort(self, key=None):
+        """
+        Method that sorts the trips in the store, by departure date if no key
+        is given.
+
+        key: a function that takes a Trip object and returns the value to sort by.
+        """
+
+        # Find the new order of the trips, then rearrange each array in it.
+        if key is None:
+            order = sorted(range(len(self)), key=self.__departures.__getitem__)
+        else:
+            order = sorted(range(len(self)), key=lambda j: key(self[j]))
+        self.__departures = array("i", [self.__departures[j] for j in order])
+        self.__durations = array("i", [self.__durations[j] for j in order])
+        self.__destinations = array("i", [self.__destinations[j] for j in order])
+
+    def intervals(self):
+        """
+        Method that returns a list of (departure, arrival) day counts, one for
+        each trip, in schedule order.
+        """
+        return [(departure, departure + duration)
+                for departure, duration in zip(self.__departures, self.__durations)]
+
+    def destination_ids(self):
+        """
+        Method that returns a list of the destination ids(see Trip.destination_id)
+        of the trips, in schedule order.
+        """
+        return [self.__name_destinations[name_id] for name_id in self.__destinations]
+
+    def __len__(self):
+        """
+        Method that returns the number of trips in the store.
+        """
+        return len(self.__departures)
+
+    def __getitem__(self, j):
+        """
+        Method that returns a new Trip object for the j-th trip in the store.
+
+        j: an index value, which may be negative to count from the end.
+        """
+        return Trip(self.__names[self.__destinations[j]],
+                    Date.fromdaycount(self.__departures[j]), self.__durations[j])
+
+    def __delitem__(self, j):
+        """
+        Method that removes the j-th trip from the store.
+
+        j: an index value, which may be negative to count from the end.
+        """
+        del self.__departures[j]
+        del self.__durations[j]
+        del self.__destinations[j]
+
+    def __iter__(self):
+        """
+        Method that returns an iterator over new Trip objects for the trips
+        in the store.
+        """
+        for j in range(len(self)):
+            yield self[j]
+
+    def __name_id(self, name):
+        """
+        Method that returns the number of a destination, adding the
+        destination to the list of destinations if it is new.
+        """
+        if name not in self.__name_ids:
+            self.__name_ids[name] = len(self.__names)
+            spelling, destination_id = catalogue.entry(name)
+            self.__names.append(spelling)
+            self.__name_destinations.append(destination_id)
+        return self.__name_ids[name]
@@ -0,0 +1,162 @@
+"""
+Author: Davis Nguyen
+
+YearCalendar class is a calendar of one year of a trip schedule, which
+can be used for things such as showing a traveller's whole year at once.
+
+Note: A YearCalendar keeps one number for each day of the year: 0 if the
+day is free, or else 1 more than the place of the trip travelling that
+day in its list of trips. Date objects are only made when asked for.
+"""
+
+# Import the array module for the days of the year.
+from array import array
+
+# Import the Date class.
+from date import Date
+
+def year_layout(year):
+    """
+    Function that returns a tuple (first, month_starts, weekday) for a year:
+    the day count of January 1, the days before each month followed by the
+    days in the year, and the day of week of January 1 as a place in
+    Date.day_names. It can be worked out once and shared by many calendars
+    of the same year.
+    """
+    jan1 = Date(1, 1, year)
+    leap = jan1.year_is_leap()
+    return (jan1.daycount(), Date.days_before_month[leap] + (366 if leap else 365,),
+            Date.day_names.index(jan1.day_of_week()))
+
+def empty_days(count):
+    """
+    Function that returns an array of count zeros, one for each day.
+    """
+    return array("i", [0]) * count
+
+
+class YearCalendar:
+    """
+    Class called "YearCalendar" that keeps track of which days of a year are
+    free, which trip is travelling on each other day, and the day of week of
+    each day. It is made with the calendar method of TripSchedule.
+    """
+
+    def __init__(self, year, trips, days, layout=None):
+        """
+        Constructor that creates a calendar.
+
+        year: the year of the calendar(an integer).
+        trips: a list of the Trip objects travelling during the year.
+        days: an array with a number for each day of the year, 0 if the day
+        is free, or else 1 more than the place of its trip in trips.
+        layout: the layout of the year from year_layout, or None to work
+        it out.
+        """
+        self.__year = year
+        self.__trips = trips
+        self.__days = days
+
+        # The day count of January 1, the days before each month followed by
+        # the days in the year, and the day of week of January 1, as a place
+        # in Date.day_names.
+        if layout is None:
+            layout = year_layout(year)
+        self.__first, self.__month_starts, self.__dow_jan1 = layout
+
+    def year(self):
+        """
+        Method that returns the year of the calendar.
+        """
+        return self.__year
+
+    def trips(self):
+        """
+        Method that returns a list of the trips travelling during the year.
+        """
+        return list(self.__trips)
+
+    def trip(self, month, day):
+        """
+        Method that returns the trip travelling on a day, or None if the day
+        is free.
+
+        month: an integer between 1 and 12 representing a month.
+        day: an integer representing a day of the month.
+        """
+        place = self.__days[self.__day_of_year(month, day)]
+        return self.__trips[place - 1] if place else None
+
+    def is_free(self, month, day):
+        """
+        Method that returns True if there is no travel on a day and False
+        otherwise.
+
+        month: an integer between 1 and 12 representing a month.
+        day: an integer representing a day of the month.
+        """
+        return self.__days[self.__day_of_year(month, day)] == 0
+
+    def weekday(self, month, day):
+        """
+        Method that returns the day of the week of a day.
+
+        month: an integer between 1 and 12 representing a month.
+        day: an integer representing a day of the month.
+        """
+        return Date.day_names[(self.__dow_jan1 + self.__day_of_year(month, day)) % 7]
+
+    def free_dates(self, month=None):
+        """
+        Method that returns a list of Date objects of the free days in a month,
+        or in the whole year if no month is given.
+
+        month: an integer between 1 and 12 representing a month, or None.
+        """
+        if month is None:
+            start, end = 0, len(self.__days)
+        else:
+            start, end = self.__month_starts[month - 1], self.__month_starts[month]
+        return [Date.fromdaycount(self.__first + i) for i in range(start, end) if self.__days[i] == 0]
+
+    def __len__(self):
+        """
+        Method that returns the number of days in the year.
+        """
+        return len(self.__days)
+
+    def __iter__(self):
+        """
+        Method that returns an iterator over the days of the year, as tuples
+        (month, day, weekday, trip), where trip is None on a free day.
+        """
+        month = 1
+        for i in range(len(self.__days)):
+            while month < 12 and i >= self.__month_starts[month]:
+                month += 1
+            place = self.__days[i]
+            yield (month, i - self.__month_starts[month - 1] + 1,
+                   Date.day_names[(self.__dow_jan1 + i) % 7],
+                   self.__trips[place - 1] if place else None)
+
+    def __day_of_year(self, month, day):
+        """
+        Method that returns the place of a day in the year, counting from 0.
+        Date is used to check that the day is valid.
+        """
+        Date(month, day, self.__year)
+        return self.__month_starts[month - 1] + day - 1
+
+    def __str__(self):
+        """
+        Method that returns a short summary of the calendar.
+        """
+        busy = sum(1 for place in self.__days if place)
+        return "{}: {} days travelling, {} days free".format(self.__year, busy, len(self.__days) - busy)
+
+    def __repr__(self):
+        """
+        Method that returns a suitable string representation of the calendar.
+        """
+        return str(self)
+